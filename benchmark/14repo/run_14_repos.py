@@ -148,14 +148,30 @@ def has_screen() -> bool:
     return shutil.which("screen") is not None
 
 
+def active_screen_names(screen_output, prefix=""):
+    """Return the session names listed by `screen -ls` (lines like "\t<pid>.<name>\t(...)").
+
+    Only names starting with prefix are kept, with the prefix removed.
+    """
+    names = set()
+    for line in screen_output.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        pid, dot, name = fields[0].partition(".")
+        if dot and pid.isdigit() and name.startswith(prefix):
+            names.add(name[len(prefix):])
+    return names
+
+
 def count_running_screens(repo_names, session_code):
     try:
         result = subprocess.run(["screen", "-ls"], capture_output=True, text=True)
-        screen_output = result.stdout
+        # Screens are named f"{session_code}_{repo}", so this yields repo names
+        active = active_screen_names(result.stdout, f"{session_code}_")
         running, finished = [], []
         for repo in repo_names:
-            screen_name = f"{session_code}_{repo}"
-            if f".{screen_name}\t" in screen_output or f".{screen_name} " in screen_output:
+            if repo in active:
                 running.append(repo)
             else:
                 finished.append(repo)
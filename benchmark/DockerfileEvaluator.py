@@ -17,6 +17,7 @@ import random
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import os
 import re
@@ -25,6 +26,12 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+from json_io import read_json, write_json
+
+
+class EvaluationCancelled(Exception):
+    """Raised by DockerfileEvaluator.evaluate() when cancel() was called while it ran"""
+
 
 @dataclass
 class TestResult:
@@ -55,18 +62,33 @@ class DockerfileEvaluator:
         self.tests: List[Dict[str, Any]] = []
         self.build_log: Dict[str, Any] = {}  # Store detailed build information
         self.running_container_id: Optional[str] = None  # Track running container
+        self.cancelled = threading.Event()  # Set by cancel() from another thread
+    
+    def cancel(self):
+        """
+        Ask a running evaluate() to stop.
+        
+        evaluate() checks this after the build and before each test, then cleans
+        up its own Docker resources and raises EvaluationCancelled. A step that
+        is already running (a build or a single test command) finishes first.
+        """
+        self.cancelled.set()
+    
+    def _check_cancelled(self):
+        """Raise EvaluationCancelled if cancel() has been called"""
+        if self.cancelled.is_set():
+            raise EvaluationCancelled(f"Evaluation of {self.dockerfile_path} was cancelled")
         
     def load_rubric(self) -> Dict[str, Any]:
         """Load and parse the JSON rubric file"""
         try:
-            with open(self.rubric_path, 'r') as f:
-                rubric = json.load(f)
+            rubric = read_json(self.rubric_path)
             print(f"Loaded rubric for repo: {rubric.get('repo', 'unknown')}")
             return rubric
         except FileNotFoundError:
             print(f"Error: Rubric file not found: {self.rubric_path}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             print(f"Error: Invalid JSON in rubric file: {e}")
             sys.exit(1)
     
@@ -426,15 +448,21 @@ class DockerfileEvaluator:
         # Start a new container
         return self.start_container()
     
+    @staticmethod
+    def _is_container_down_error(stderr: str) -> bool:
+        """Check if docker exec failed because the container itself is unavailable"""
+        if not stderr.startswith("Error response from daemon"):
+            return False
+        stderr = stderr.lower()
+        return any(phrase in stderr for phrase in ["is not running", "is restarting", "no such container"])
+    
     def run_docker_command(self, command: str, timeout: int = -1):
         """Run a command inside the persistent Docker container with automatic recovery"""
         if not self.running_container_id:
             return False, "", "No running container available"
         
-        # Ensure container is running before executing command
-        if not self.ensure_container_running():
-            return False, "", "Could not ensure container is running"
-            
+        # Exec into the persistent container optimistically; its state is only
+        # inspected (and recovered) when the daemon reports it is not running
         max_retries = 2
         for attempt in range(max_retries):
             try:
@@ -462,6 +490,16 @@ class DockerfileEvaluator:
                         errors='replace'
                     )            
                 success = result.returncode == 0
+                
+                if not success and attempt < max_retries - 1 and self._is_container_down_error(result.stderr):
+                    print(f"Container issue detected: {result.stderr.strip()}")
+                    print(f"Attempting recovery (attempt {attempt + 1}/{max_retries})...")
+                    
+                    if not self.ensure_container_running():
+                        return False, "", "Could not recover container after failure"
+                    
+                    continue
+                
                 return success, result.stdout, result.stderr
                 
             except subprocess.TimeoutExpired:
@@ -740,6 +778,7 @@ class DockerfileEvaluator:
             tests_to_remove = []
             
             for i, test in enumerate(remaining_tests):
+                self._check_cancelled()
                 if self.can_run_test(test, completed_tests):
                     print(f"Running test: {test.get('type', 'unknown')}")
                     result = self.run_single_test(test)
@@ -975,6 +1014,10 @@ class DockerfileEvaluator:
             print("Failed to build Docker image, cannot run tests")
             return self.generate_report()
         
+        if self.cancelled.is_set():
+            self.cleanup()  # Remove the image that was just built
+            self._check_cancelled()
+        
         # Start persistent container
         if not self.start_container():
             print("Failed to start container, cannot run tests")
@@ -1027,8 +1070,7 @@ def main():
         
         # Save report if requested
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(report, f, indent=2)
+            write_json(args.output, report)
             print(f"\nReport saved to: {args.output}")
         
         # Print detailed results if verbose
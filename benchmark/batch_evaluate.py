@@ -19,16 +19,35 @@ Usage:
     
     # All repositories
     python batch_evaluate.py --all-repos
+    
+    # Evaluate up to 4 dockerfiles of a repository concurrently
+    python batch_evaluate.py --repo facebook_zstd --jobs 4
 """
 
 import argparse
+import asyncio
 import subprocess
 import json
 import os
+import shutil
 import sys
 import csv
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Iterator, Set
+
+from DockerfileEvaluator import DockerfileEvaluator, EvaluationCancelled
+from json_io import PARAMS_DIGEST_VERSION, params_digest, read_json, write_json
+
+# Per-dockerfile evaluation timeout: slightly longer than DockerfileEvaluator's
+# internal build timeout (3600s + 300s buffer)
+EVALUATION_TIMEOUT = 3900
+
+# Subdirectory of the rubric dir holding derived rubric metadata for --rubric-cache
+RUBRIC_CACHE_DIR = ".cache"
 
 
 def validate_rubric(rubric_path: Path, repo_name: str) -> Tuple[bool, List[str]]:
@@ -51,9 +70,8 @@ def validate_rubric(rubric_path: Path, repo_name: str) -> Tuple[bool, List[str]]
     
     # Try to parse JSON
     try:
-        with open(rubric_path, 'r', encoding='utf-8') as f:
-            rubric = json.load(f)
-    except json.JSONDecodeError as e:
+        rubric = read_json(rubric_path)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         errors.append(f"Invalid JSON syntax: {e}")
         return False, errors
     except Exception as e:
@@ -231,6 +249,39 @@ def read_repos_from_file(file_path: str) -> List[str]:
         return []
 
 
+def _walk_for_dockerfiles(dir_path: str, relative_parts: List[str], repo_name: str,
+                          in_repo: bool) -> Iterator[Tuple[str, str]]:
+    """
+    Recursively yield envgym.dockerfile files below dir_path that have repo_name
+    as a path component, in the same pre-order as Path.rglob.
+    
+    Uses os.scandir so directory entries are classified from the directory
+    listing itself instead of a separate stat per entry.
+    
+    Args:
+        dir_path: Directory to scan
+        relative_parts: Path components of dir_path relative to the baseline directory
+        repo_name: Repository name to match
+        in_repo: Whether repo_name already appears in an ancestor path component
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry)
+        elif in_repo and entry.name == "envgym.dockerfile":
+            yield entry.path, os.path.join(*relative_parts, entry.name)
+    
+    for entry in subdirs:
+        yield from _walk_for_dockerfiles(entry.path, relative_parts + [entry.name], repo_name,
+                                         in_repo or entry.name == repo_name)
+
+
 def find_dockerfiles(repo_name: str, baseline_dir: str = "ENVGYM-baseline") -> List[Tuple[str, str]]:
     """
     Find all envgym.dockerfile files for the given repo.
@@ -239,17 +290,9 @@ def find_dockerfiles(repo_name: str, baseline_dir: str = "ENVGYM-baseline") -> L
         List of tuples: (dockerfile_path, relative_path_from_baseline)
     """
     baseline_path = Path(baseline_dir)
-    dockerfiles = []
     
-    # Search for envgym.dockerfile files containing the repo name
-    for dockerfile_path in baseline_path.rglob("envgym.dockerfile"):
-        # Check if this dockerfile is for the target repo
-        if repo_name in str(dockerfile_path):
-            # Get relative path from baseline directory
-            relative_path = dockerfile_path.relative_to(baseline_path)
-            dockerfiles.append((str(dockerfile_path), str(relative_path)))
-    
-    return dockerfiles
+    # Search for envgym.dockerfile files with the repo name as a path component
+    return list(_walk_for_dockerfiles(str(baseline_path), [], repo_name, repo_name in baseline_path.parts))
 
 
 def create_report_path(relative_dockerfile_path: str, reports_dir: str = "reports-by-model") -> str:
@@ -264,9 +307,8 @@ def create_report_path(relative_dockerfile_path: str, reports_dir: str = "report
         Report path: e.g., "reports-by-model/claude/claude35haiku/facebook_zstd/evaluation_report.json"
     """
     # Replace envgym.dockerfile with evaluation_report.json
-    path_parts = Path(relative_dockerfile_path).parts[:-1]  # Remove envgym.dockerfile
-    report_path = Path(reports_dir) / Path(*path_parts) / "evaluation_report.json"
-    return str(report_path)
+    dockerfile_dir = os.path.dirname(relative_dockerfile_path)  # Remove envgym.dockerfile
+    return os.path.join(reports_dir, dockerfile_dir, "evaluation_report.json")
 
 
 def cleanup_docker_containers(repo_name: str) -> None:
@@ -288,9 +330,64 @@ def cleanup_docker_containers(repo_name: str) -> None:
         print(f"Warning: Could not clean up containers: {e}")
 
 
-def run_evaluation(dockerfile_path: str, repo_name: str, report_path: str, rubric_dir: str = "rubrics/manual", verbose: bool = False, skip_warnings: bool = False) -> bool:
+# In-process evaluators that are running now, so an interrupt can cancel them
+_running_evaluators: Set[DockerfileEvaluator] = set()
+_running_evaluators_lock = threading.Lock()
+
+
+# Per-thread capture buffer for evaluator output, set by run_evaluation
+_thread_output = threading.local()
+_output_router_lock = threading.Lock()
+
+
+class _ThreadOutputRouter:
+    """
+    Stand-in for sys.stdout/sys.stderr that sends writes from a thread with a
+    capture buffer to that buffer, and everything else to the real stream.
+    
+    In-process evaluations print their build and test progress; capturing it
+    per thread keeps concurrent evaluations (--jobs) from interleaving on the
+    console, like the captured output of the DockerfileEvaluator.py subprocess.
+    """
+    
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(_thread_output, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self) -> None:
+        if getattr(_thread_output, 'buffer', None) is None:
+            self._stream.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def _install_output_router() -> None:
+    """Route sys.stdout and sys.stderr through _ThreadOutputRouter, once per process."""
+    with _output_router_lock:
+        if not isinstance(sys.stdout, _ThreadOutputRouter):
+            sys.stdout = _ThreadOutputRouter(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadOutputRouter):
+            sys.stderr = _ThreadOutputRouter(sys.stderr)
+
+
+def cancel_running_evaluations() -> None:
+    """Ask every in-process evaluation that is still running to stop and clean up after itself."""
+    with _running_evaluators_lock:
+        for evaluator in _running_evaluators:
+            evaluator.cancel()
+
+
+def run_evaluation(dockerfile_path: str, repo_name: str, report_path: str, rubric_dir: str = "rubrics/manual", verbose: bool = False, skip_warnings: bool = False, legacy_subprocess: bool = False) -> bool:
     """
-    Run DockerfileEvaluator.py on a single dockerfile.
+    Evaluate a single dockerfile and save its report to report_path.
+    
+    The evaluation runs in-process through DockerfileEvaluator unless
+    legacy_subprocess is set, in which case DockerfileEvaluator.py is run
+    in a separate interpreter.
     
     Returns:
         True if evaluation succeeded, False otherwise
@@ -298,6 +395,87 @@ def run_evaluation(dockerfile_path: str, repo_name: str, report_path: str, rubri
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(report_path), exist_ok=True)
     
+    if legacy_subprocess:
+        return _run_evaluation_subprocess(dockerfile_path, repo_name, report_path, rubric_dir, verbose, skip_warnings)
+    
+    evaluator = DockerfileEvaluator(repo_name, dockerfile_path, rubric_dir, skip_warnings)
+    outcome: Dict[str, Any] = {}
+    # The evaluator's own output is captured and only shown with --verbose on failure
+    _install_output_router()
+    output = io.StringIO()
+    
+    def _evaluate() -> None:
+        _thread_output.buffer = output
+        try:
+            outcome['report'] = evaluator.evaluate()
+        except BaseException as e:  # DockerfileEvaluator exits via SystemExit on rubric errors
+            outcome['error'] = e
+    
+    # evaluate() can only stop between steps, so run it on a daemon thread and
+    # cancel it once the timeout expires
+    worker = threading.Thread(target=_evaluate, daemon=True)
+    with _running_evaluators_lock:
+        _running_evaluators.add(evaluator)
+    try:
+        worker.start()
+        worker.join(EVALUATION_TIMEOUT)
+        
+        if worker.is_alive():
+            print(f"TIMEOUT: Evaluation timed out after 65 minutes: {dockerfile_path}")
+            print(f"  This indicates the Docker build or evaluation process is stuck")
+            # Wait for it to finish its current step and clean up after itself, so it
+            # doesn't keep running alongside the next evaluations
+            evaluator.cancel()
+            worker.join()
+            return False
+    finally:
+        with _running_evaluators_lock:
+            _running_evaluators.discard(evaluator)
+    
+    if 'error' in outcome:
+        print(f"FAIL: Failed to evaluate: {dockerfile_path}")
+        if verbose:
+            print(f"  ERROR: {type(outcome['error']).__name__}: {outcome['error']}")
+            print(f"  OUTPUT: {output.getvalue()}")
+        if not isinstance(outcome['error'], EvaluationCancelled):  # Already cleaned up
+            evaluator.cleanup()
+        return False
+    
+    try:
+        report = outcome['report']
+        write_json(report_path, report)
+        
+        # Mirror DockerfileEvaluator.py's exit code: any failed test fails the run
+        if report['summary']['failed_tests'] != 0:
+            print(f"FAIL: Failed to evaluate: {dockerfile_path}")
+            if verbose:
+                print(f"  Report: {report_path}")
+                print(f"  OUTPUT: {output.getvalue()}")
+            return False
+    except Exception as e:
+        print(f"ERROR: Error evaluating {dockerfile_path}: {e}")
+        return False
+    
+    # Check if the evaluation actually succeeded by inspecting the in-memory report
+    if _validate_report_dict(report):
+        print(f"SUCCESS: Successfully evaluated: {dockerfile_path}")
+        print(f"  Report saved to: {report_path}")
+        return True
+    else:
+        print(f"FAIL: Evaluation completed but failed (check report): {dockerfile_path}")
+        if verbose:
+            print(f"  Report: {report_path}")
+        return False
+
+
+def _run_evaluation_subprocess(dockerfile_path: str, repo_name: str, report_path: str, rubric_dir: str,
+                               verbose: bool, skip_warnings: bool) -> bool:
+    """
+    Run DockerfileEvaluator.py on a single dockerfile in a separate interpreter.
+    
+    Returns:
+        True if evaluation succeeded, False otherwise
+    """
     # Build command to run DockerfileEvaluator.py
     cmd = [
         sys.executable, "DockerfileEvaluator.py",
@@ -317,8 +495,7 @@ def run_evaluation(dockerfile_path: str, repo_name: str, report_path: str, rubri
     
     try:
         # Run the evaluation with UTF-8 encoding to handle Unicode characters
-        # Add timeout slightly longer than DockerfileEvaluator's internal timeout (3600s + 300s buffer)
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=3900)
+        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=EVALUATION_TIMEOUT)
         
         if result.returncode == 0:
             # Check if the evaluation actually succeeded by inspecting the report
@@ -349,18 +526,29 @@ def run_evaluation(dockerfile_path: str, repo_name: str, report_path: str, rubri
 
 def _validate_evaluation_success(report_path: str) -> bool:
     """
-    Validate that the evaluation actually succeeded by checking the report content.
+    Validate that the evaluation actually succeeded by checking the report file.
     
     Returns:
         True if the evaluation was successful, False if it failed
     """
     try:
-        if not os.path.exists(report_path):
-            return False
-            
-        with open(report_path, 'r', encoding='utf-8') as f:
-            report = json.load(f)
+        # read_json parses with orjson when available; a missing file raises
+        # FileNotFoundError, so no separate existence check is needed
+        return _validate_report_dict(read_json(report_path))
         
+    except Exception:
+        # If we can't read or parse the report, consider it a failure
+        return False
+
+
+def _validate_report_dict(report: Dict[str, Any]) -> bool:
+    """
+    Validate that the evaluation actually succeeded by checking the report content.
+    
+    Returns:
+        True if the evaluation was successful, False if it failed
+    """
+    try:
         # Check for build errors
         build_log = report.get('build_log', {})
         if 'error_message' in build_log:
@@ -377,10 +565,53 @@ def _validate_evaluation_success(report_path: str) -> bool:
         return True
         
     except Exception:
-        # If we can't read or parse the report, consider it a failure
+        # If the report is malformed, consider it a failure
         return False
 
 
+def _index_reports(reports_by_model_path: Path) -> Dict[str, List[Path]]:
+    """
+    Walk reports-by-model once and group evaluation reports by repository.
+    
+    A report belongs to the repo named by its parent directory, or by its
+    grandparent when the parent is an envgym/ directory.
+    
+    Returns:
+        Dictionary mapping repo names to report paths, direct matches first,
+        then envgym/ matches
+    """
+    direct_reports: Dict[str, List[Path]] = {}
+    envgym_reports: Dict[str, List[Path]] = {}
+    for report_path in reports_by_model_path.rglob("evaluation_report.json"):
+        parent = report_path.parent
+        if parent.name == "envgym":
+            envgym_reports.setdefault(parent.parent.name, []).append(report_path)
+        else:
+            direct_reports.setdefault(parent.name, []).append(report_path)
+    
+    index = direct_reports
+    for repo_name, reports in envgym_reports.items():
+        index.setdefault(repo_name, []).extend(reports)
+    return index
+
+
+def _find_repo_reports(reports_by_model_path: Path, repo_name: str,
+                       index: Optional[Dict[str, List[Path]]] = None) -> List[Path]:
+    """
+    Find all evaluation reports for a repository.
+    
+    Matches both */{repo_name}/evaluation_report.json and
+    */{repo_name}/envgym/evaluation_report.json, using a prebuilt index from
+    _index_reports when given instead of walking the directory tree.
+    
+    Returns:
+        List of report paths, direct matches first, then envgym/ matches
+    """
+    if index is None:
+        index = _index_reports(reports_by_model_path)
+    return list(index.get(repo_name, []))
+
+
 def _copy_model_reports(repo_reports: List[Path], reports_by_model_path: Path, models_dir: Path) -> None:
     """
     Copy individual model reports to models directory with flattened names.
@@ -393,10 +624,10 @@ def _copy_model_reports(repo_reports: List[Path], reports_by_model_path: Path, m
     for report_path in repo_reports:
         try:
             # Get relative path from reports-by-model to the report file
-            relative_path = report_path.relative_to(reports_by_model_path)
+            relative_path = str(report_path.relative_to(reports_by_model_path))
             
             # Remove the filename (evaluation_report.json) and any envgym directory
-            path_parts = list(relative_path.parts[:-1])  # Remove evaluation_report.json
+            path_parts = relative_path.split(os.sep)[:-1]  # Remove evaluation_report.json
             if path_parts and path_parts[-1] == "envgym":
                 path_parts = path_parts[:-1]  # Remove envgym if present
             
@@ -411,10 +642,16 @@ def _copy_model_reports(repo_reports: List[Path], reports_by_model_path: Path, m
             else:
                 flattened_name = "unknown_report.json"
             
-            # Copy the report file
+            # Hardlink the report file, falling back to a copy across filesystems or
+            # where links are unsupported. Reports are only ever rewritten by
+            # write_json, which replaces the file rather than editing it in place,
+            # so the link keeps the content it was made with
             target_path = models_dir / flattened_name
-            import shutil
-            shutil.copy2(report_path, target_path)
+            target_path.unlink(missing_ok=True)
+            try:
+                os.link(report_path, target_path)
+            except OSError:
+                shutil.copy2(report_path, target_path)
             
         except Exception as e:
             print(f"Warning: Could not copy report {report_path}: {e}")
@@ -430,7 +667,7 @@ def extract_model_info(relative_dockerfile_path: str) -> str:
     Returns:
         Model identifier: e.g., "claude/claude35haiku"
     """
-    path_parts = Path(relative_dockerfile_path).parts
+    path_parts = relative_dockerfile_path.split(os.sep)
     if len(path_parts) >= 3:
         # Handle both structures: provider/model/repo and provider/subprovider/model/repo
         if path_parts[0] == "ours" and len(path_parts) >= 4:
@@ -442,100 +679,189 @@ def extract_model_info(relative_dockerfile_path: str) -> str:
     return "unknown"
 
 
-def create_repo_csv(repo_name: str, reports_by_model_dir: str = "reports-by-model",
-                    reports_by_repo_dir: str = "reports-by-repo", rubric_dir: str = "rubrics/manual") -> bool:
+
+def _run_writers_concurrently(*writers: Tuple[Any, ...]) -> None:
     """
-    Create a CSV file comparing test performance across all models for a repository.
+    Run independent file writers concurrently on worker threads.
     
     Args:
-        repo_name: Repository name
-        reports_by_model_dir: Directory containing individual model reports
-        reports_by_repo_dir: Directory to save repo CSV
+        writers: Tuples of (writer_function, *args)
+    """
+    async def _gather() -> None:
+        await asyncio.gather(*(asyncio.to_thread(fn, *args) for fn, *args in writers))
     
-    Returns:
-        True if CSV created successfully, False otherwise
+    asyncio.run(_gather())
+
+
+# Row template for the markdown comparison table: model, score, success %, time, tests
+_COMPARISON_ROW_FMT = "| %s | %s | %s | %s | %s |\n"
+
+
+def _write_repo_comparison_md(table_path: str, repo_name: str, model_data: List[Dict[str, Any]]) -> None:
+    """Write the markdown model comparison table for a repository."""
+    lines = [
+        f"# Repository: {repo_name}\n\n",
+        # Markdown table header
+        "| Model | Score | Success % | Time (s) | Tests |\n",
+        "|-------|-------|-----------|----------|-------|\n",
+    ]
+    
+    # Table rows
+    row_fmt = _COMPARISON_ROW_FMT
+    for data in model_data:
+        lines.append(row_fmt % (
+            data['model'],
+            f"{data['total_score']}/{data['max_score']}",
+            f"{data['success_rate']:.1%}",
+            f"{data['total_time']:.1f}",
+            f"{data['passed_tests']}/{data['total_tests']}",
+        ))
+    
+    lines.append("\n")
+    if model_data:
+        best = model_data[0]
+        lines.append(f"**Best Performer:** {best['model']} "
+                     f"(Score: {best['total_score']}/{best['max_score']}, "
+                     f"Success: {best['success_rate']:.1%})\n")
+    
+    # Emit the whole table in a single write
+    with open(table_path, 'w') as f:
+        f.write("".join(lines))
+
+
+@lru_cache(maxsize=None)
+def _load_rubric(rubric_path: str) -> Dict[str, Any]:
+    """Load a rubric JSON file, caching the parsed result for the rest of the run."""
+    return read_json(rubric_path)
+
+
+@lru_cache(maxsize=None)
+def _rubric_test_info(rubric_path: str, use_cache: bool = False) -> Dict[str, Dict[str, Any]]:
     """
-    # Find all evaluation reports for this repo
-    reports_by_model_path = Path(reports_by_model_dir)
-    repo_reports = list(reports_by_model_path.rglob(f"*/{repo_name}/evaluation_report.json"))
-    repo_reports += list(reports_by_model_path.rglob(f"*/{repo_name}/envgym/evaluation_report.json"))
+    Map rubric test IDs to their CSV metadata, serializing each test's params once per run.
     
-    if not repo_reports:
-        print(f"No reports found for repository: {repo_name}")
-        return False
+    Args:
+        rubric_path: Path to the rubric JSON file
+        use_cache: Reuse (and refresh) the derived metadata in RUBRIC_CACHE_DIR across runs,
+            as long as it is not older than the rubric
     
-    # Load the rubric to get test metadata and params
-    rubric_path = Path(f"{rubric_dir}/{repo_name}.json")
-    if not rubric_path.exists():
-        raise FileNotFoundError(f"Rubric file not found: {rubric_path}")
+    Returns:
+        Dictionary mapping test_id to {test_type, max_score, params}
+    """
+    # Generated test ids are cached too, so the cache is kept per digest scheme
+    cache_path = os.path.join(os.path.dirname(rubric_path), RUBRIC_CACHE_DIR, f"ids-v{PARAMS_DIGEST_VERSION}",
+                              os.path.basename(rubric_path))
+    if use_cache:
+        try:
+            if os.stat(cache_path).st_mtime >= os.stat(rubric_path).st_mtime:
+                return read_json(cache_path)
+        except (OSError, ValueError):
+            pass  # Missing, stale or unreadable cache; rebuild it from the rubric
     
-    try:
-        with open(rubric_path, 'r') as rf:
-            rubric = json.load(rf)
-    except Exception as e:
-        raise ValueError(f"Failed to parse rubric file {rubric_path}: {e}")
+    rubric = _load_rubric(rubric_path)
     
-    # Create mapping from test_id to rubric test info
     rubric_test_info = {}
     for test in rubric.get('tests', []):
-        test_id = test.get('id', f"{test.get('type', 'unknown')}_{hash(str(test.get('params', {})))}")
+        test_id = test.get('id') or f"{test.get('type', 'unknown')}_{params_digest(test.get('params') or {})}"
         rubric_test_info[test_id] = {
             'test_type': test.get('type', ''),
             'max_score': test.get('score', 1),
             'params': json.dumps(test.get('params', {}), separators=(',', ':'))  # Compact JSON string
         }
     
-    # Collect all test data from reports
-    models_data: Dict[str, Dict[str, float]] = {}  # model_id -> {test_id -> score}
-    all_test_ids: set = set()
-    test_info: Dict[str, Dict[str, Any]] = {}  # test_id -> {test_type, max_score, params}
-    
-    for report_path in repo_reports:
+    if use_cache:
         try:
-            with open(report_path, 'r') as f:
-                report = json.load(f)
-            
-            # Extract model info from path
-            relative_path = report_path.relative_to(reports_by_model_path)
-            model_id = extract_model_info(str(relative_path))
-            
-            # Extract test results
-            test_results = report.get('test_results', [])
-            models_data[model_id] = {}
-            
-            for test_result in test_results:
-                test_id = test_result.get('test_id', '')
-                test_type = test_result.get('test_type', '')
-                score = test_result.get('score', 0)
-                
-                if test_id:
-                    all_test_ids.add(test_id)
-                    models_data[model_id][test_id] = score
-                    
-                    # Store test metadata from rubric
-                    if test_id not in test_info:
-                        if test_id in rubric_test_info:
-                            test_info[test_id] = rubric_test_info[test_id]
-                        else:
-                            # Fallback if test_id not found in rubric
-                            test_info[test_id] = {
-                                'test_type': test_type,
-                                'max_score': 1,
-                                'params': '{}'  # Empty params
-                            }
-                        
-        except Exception as e:
-            print(f"Warning: Could not process report {report_path}: {e}")
-            continue
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            write_json(cache_path, rubric_test_info)
+        except OSError as e:
+            print(f"Warning: Could not write rubric cache {cache_path}: {e}")
+    return rubric_test_info
+
+
+def _load_repo_rubric_info(repo_name: str, rubric_dir: str, rubric_cache: bool) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the CSV metadata for every test in a repository's rubric.
+    
+    Raises:
+        FileNotFoundError: If the rubric file does not exist
+        ValueError: If the rubric file cannot be parsed
+    """
+    rubric_path = Path(f"{rubric_dir}/{repo_name}.json")
+    if not rubric_path.exists():
+        raise FileNotFoundError(f"Rubric file not found: {rubric_path}")
+    
+    try:
+        return _rubric_test_info(str(rubric_path), rubric_cache)
+    except Exception as e:
+        raise ValueError(f"Failed to parse rubric file {rubric_path}: {e}")
+
+
+def _collect_test_scores(report: Dict[str, Any], model_id: str, models_data: Dict[str, Dict[str, float]],
+                         reported_types: Dict[str, str]) -> None:
+    """
+    Record one model's per-test scores from a parsed report.
+    
+    Args:
+        report: Parsed evaluation report
+        model_id: Model identifier for the report
+        models_data: model_id -> {test_id -> score rounded to 2 places}, updated in place
+        reported_types: test_id -> test_type as first reported, updated in place
+    """
+    model_scores = models_data[model_id] = {}
     
-    if not models_data or not all_test_ids:
+    for test_result in report.get('test_results', []):
+        test_id = test_result.get('test_id', '')
+        score = test_result.get('score', 0)
+        
+        if test_id:
+            # Round once here so the CSV emit loop is plain lookups
+            model_scores[test_id] = round(score, 2) if isinstance(score, (int, float)) else score
+            if test_id not in reported_types:
+                reported_types[test_id] = test_result.get('test_type', '')
+
+
+def _write_repo_csv(repo_name: str, repo_reports: List[Path], reports_by_model_path: Path,
+                    reports_by_repo_dir: str, rubric_test_info: Dict[str, Dict[str, Any]],
+                    models_data: Dict[str, Dict[str, float]], reported_types: Dict[str, str]) -> bool:
+    """
+    Write the test comparison CSV and copy model reports from collected test scores.
+    
+    Args:
+        repo_name: Repository name
+        repo_reports: Report paths for this repo
+        reports_by_model_path: Base path for reports-by-model directory
+        reports_by_repo_dir: Directory to save repo CSV
+        rubric_test_info: Rubric test metadata from _load_repo_rubric_info
+        models_data: model_id -> {test_id -> score}, from _collect_test_scores
+        reported_types: test_id -> reported test_type, from _collect_test_scores
+    
+    Returns:
+        True if CSV created successfully, False otherwise
+    """
+    if not models_data or not reported_types:
         print(f"No valid test data found for repository: {repo_name}")
         return False
     
     # Sort test IDs and model IDs for consistent ordering
-    sorted_test_ids = sorted(all_test_ids)
+    sorted_test_ids = sorted(reported_types)
     sorted_model_ids = sorted(models_data.keys())
     
+    # Test metadata columns as parallel lists aligned with sorted_test_ids,
+    # falling back to the reported type for tests missing from the rubric
+    test_types = []
+    max_scores = []
+    params_strs = []
+    for test_id in sorted_test_ids:
+        info = rubric_test_info.get(test_id)
+        if info is None:
+            test_types.append(reported_types[test_id])
+            max_scores.append(1)
+            params_strs.append('{}')  # Empty params
+        else:
+            test_types.append(info.get('test_type', ''))
+            max_scores.append(info.get('max_score', 1))
+            params_strs.append(info.get('params', '{}'))
+    
     # Create output directory structure
     repo_output_dir = Path(reports_by_repo_dir) / repo_name
     models_dir = repo_output_dir / "models"
@@ -548,66 +874,105 @@ def create_repo_csv(repo_name: str, reports_by_model_dir: str = "reports-by-mode
     csv_path = repo_output_dir / f"{repo_name}_test_comparison.csv"
     
     with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        # Prepare header
-        fieldnames = ['test_id', 'test_type', 'max_score'] + sorted_model_ids + ['params']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        # Write header
+        writer = csv.writer(csvfile)
+        writer.writerow(['test_id', 'test_type', 'max_score'] + sorted_model_ids + ['params'])
+        
+        # Bind each model's score lookup once, in column order
+        per_model_get = [models_data[model_id].get for model_id in sorted_model_ids]
         
-        # Write data rows
-        for test_id in sorted_test_ids:
-            row = {
-                'test_id': test_id,
-                'test_type': test_info.get(test_id, {}).get('test_type', ''),
-                'max_score': test_info.get(test_id, {}).get('max_score', 1),
-                'params': test_info.get(test_id, {}).get('params', '{}')
-            }
+        # Write data rows, with columns in header order
+        for i, test_id in enumerate(sorted_test_ids):
+            row = [test_id, test_types[i], max_scores[i]]
             
             # Add scores for each model (0 if test not found for that model)
-            for model_id in sorted_model_ids:
-                score = models_data.get(model_id, {}).get(test_id, 0)
-                row[model_id] = round(score, 2) if isinstance(score, (int, float)) else score
+            row.extend([get(test_id, 0) for get in per_model_get])
             
+            row.append(params_strs[i])
             writer.writerow(row)
     
     print(f"SUCCESS: Created test comparison CSV: {csv_path}")
     return True
 
 
-def create_repo_summary(repo_name: str, reports_by_model_dir: str = "reports-by-model", 
-                       reports_by_repo_dir: str = "reports-by-repo", rubric_dir: str = "rubrics/manual") -> bool:
+def create_repo_csv(repo_name: str, reports_by_model_dir: str = "reports-by-model",
+                    reports_by_repo_dir: str = "reports-by-repo", rubric_dir: str = "rubrics/manual",
+                    repo_reports: Optional[List[Path]] = None, rubric_cache: bool = False) -> bool:
     """
-    Create a summary report for a repository comparing all models.
+    Create a CSV file comparing test performance across all models for a repository.
     
     Args:
         repo_name: Repository name
         reports_by_model_dir: Directory containing individual model reports
-        reports_by_repo_dir: Directory to save repo summary
+        reports_by_repo_dir: Directory to save repo CSV
+        repo_reports: Report paths for this repo, if already discovered by the caller
+        rubric_cache: Reuse derived rubric metadata cached on disk by earlier runs
     
     Returns:
-        True if summary created successfully, False otherwise
+        True if CSV created successfully, False otherwise
     """
     # Find all evaluation reports for this repo
     reports_by_model_path = Path(reports_by_model_dir)
-    repo_reports = list(reports_by_model_path.rglob(f"*/{repo_name}/evaluation_report.json"))
-    repo_reports += list(reports_by_model_path.rglob(f"*/{repo_name}/envgym/evaluation_report.json"))
-    print(f"Found {len(repo_reports)} reports for repository {repo_name}: {repo_reports}")
+    if repo_reports is None:
+        repo_reports = _find_repo_reports(reports_by_model_path, repo_name)
     
     if not repo_reports:
         print(f"No reports found for repository: {repo_name}")
         return False
     
-    # Collect data from all reports
+    # Load the rubric to get test metadata and params
+    rubric_test_info = _load_repo_rubric_info(repo_name, rubric_dir, rubric_cache)
+    
+    # Collect all test data from reports
+    models_data: Dict[str, Dict[str, float]] = {}
+    reported_types: Dict[str, str] = {}
+    
+    for report_path in repo_reports:
+        try:
+            report = read_json(report_path)
+            relative_path = report_path.relative_to(reports_by_model_path)
+            _collect_test_scores(report, extract_model_info(str(relative_path)), models_data, reported_types)
+        except Exception as e:
+            print(f"Warning: Could not process report {report_path}: {e}")
+            continue
+    
+    return _write_repo_csv(repo_name, repo_reports, reports_by_model_path, reports_by_repo_dir,
+                           rubric_test_info, models_data, reported_types)
+
+
+def _build_repo_outputs(repo_name: str, repo_reports: List[Path], reports_by_model_path: Path,
+                        reports_by_repo_dir: str, rubric_dir: str, rubric_cache: bool) -> bool:
+    """
+    Build a repository's summary JSON, markdown table and test comparison CSV in one pass over its reports.
+    
+    Args:
+        repo_name: Repository name
+        repo_reports: Report paths for this repo
+        reports_by_model_path: Base path for reports-by-model directory
+        reports_by_repo_dir: Directory to save repo outputs
+        rubric_dir: Directory containing rubric files
+        rubric_cache: Reuse derived rubric metadata cached on disk by earlier runs
+    
+    Returns:
+        True if all outputs were created successfully, False otherwise
+    """
+    # Collect summary metrics and per-test scores from each report in a single read
     model_data = []
+    models_data: Dict[str, Dict[str, float]] = {}
+    reported_types: Dict[str, str] = {}
     
     for report_path in repo_reports:
         try:
-            with open(report_path, 'r') as f:
-                report = json.load(f)
+            report = read_json(report_path)
             
             # Extract model info from path
             relative_path = report_path.relative_to(reports_by_model_path)
             model_id = extract_model_info(str(relative_path))
-            
+        except Exception as e:
+            print(f"Warning: Could not process report {report_path}: {e}")
+            continue
+        
+        try:
             # Extract key metrics
             summary = report.get('summary', {})
             model_data.append({
@@ -619,10 +984,13 @@ def create_repo_summary(repo_name: str, reports_by_model_dir: str = "reports-by-
                 'passed_tests': summary.get('passed_tests', 0),
                 'total_tests': summary.get('total_tests', 0)
             })
-            
         except Exception as e:
-            print(f"Warning: Could not process report {report_path}: {e}")
-            continue
+            print(f"Warning: Could not process report summary {report_path}: {e}")
+        
+        try:
+            _collect_test_scores(report, model_id, models_data, reported_types)
+        except Exception as e:
+            print(f"Warning: Could not process report test results {report_path}: {e}")
     
     if not model_data:
         print(f"No valid reports found for repository: {repo_name}")
@@ -642,50 +1010,81 @@ def create_repo_summary(repo_name: str, reports_by_model_dir: str = "reports-by-
     }
     
     # Create output directory structure
-    repo_output_dir = Path(reports_by_repo_dir) / repo_name
+    repo_output_dir = os.path.join(reports_by_repo_dir, repo_name)
     os.makedirs(repo_output_dir, exist_ok=True)
     
-    # Save JSON summary
-    json_path = repo_output_dir / f"{repo_name}_summary.json"
-    with open(json_path, 'w') as f:
-        json.dump(summary_report, f, indent=2)
-    
-    # Create markdown comparison table
-    table_path = repo_output_dir / f"{repo_name}_comparison.md"
-    with open(table_path, 'w') as f:
-        f.write(f"# Repository: {repo_name}\n\n")
-        
-        # Markdown table header
-        f.write("| Model | Score | Success % | Time (s) | Tests |\n")
-        f.write("|-------|-------|-----------|----------|-------|\n")
-        
-        # Table rows
-        for data in model_data:
-            score_str = f"{data['total_score']}/{data['max_score']}"
-            success_pct = f"{data['success_rate']:.1%}"
-            time_str = f"{data['total_time']:.1f}"
-            tests_str = f"{data['passed_tests']}/{data['total_tests']}"
-            
-            f.write(f"| {data['model']} | {score_str} | {success_pct} | {time_str} | {tests_str} |\n")
-        
-        f.write("\n")
-        if model_data:
-            best = model_data[0]
-            f.write(f"**Best Performer:** {best['model']} ")
-            f.write(f"(Score: {best['total_score']}/{best['max_score']}, ")
-            f.write(f"Success: {best['success_rate']:.1%})\n")
+    # Save JSON summary and markdown comparison table concurrently
+    json_path = os.path.join(repo_output_dir, f"{repo_name}_summary.json")
+    table_path = os.path.join(repo_output_dir, f"{repo_name}_comparison.md")
+    _run_writers_concurrently(
+        (write_json, json_path, summary_report),
+        (_write_repo_comparison_md, table_path, repo_name, model_data),
+    )
     
-    # Create CSV comparison
-    csv_success = create_repo_csv(repo_name, reports_by_model_dir, reports_by_repo_dir, rubric_dir)
+    # Create CSV comparison from the same collected data
+    rubric_test_info = _load_repo_rubric_info(repo_name, rubric_dir, rubric_cache)
+    csv_success = _write_repo_csv(repo_name, repo_reports, reports_by_model_path, reports_by_repo_dir,
+                                  rubric_test_info, models_data, reported_types)
     
     print(f"SUCCESS: Created repo summary: {json_path}")
     print(f"SUCCESS: Created comparison table (markdown): {table_path}")
-    return True and csv_success
+    return csv_success
+
+
+def create_repo_summary(repo_name: str, reports_by_model_dir: str = "reports-by-model", 
+                       reports_by_repo_dir: str = "reports-by-repo", rubric_dir: str = "rubrics/manual",
+                       index: Optional[Dict[str, List[Path]]] = None, rubric_cache: bool = False) -> bool:
+    """
+    Create a summary report for a repository comparing all models.
+    
+    Args:
+        repo_name: Repository name
+        reports_by_model_dir: Directory containing individual model reports
+        reports_by_repo_dir: Directory to save repo summary
+        index: Prebuilt repo -> report paths mapping from _index_reports (optional)
+        rubric_cache: Reuse derived rubric metadata cached on disk by earlier runs
+    
+    Returns:
+        True if summary created successfully, False otherwise
+    """
+    # Find all evaluation reports for this repo
+    reports_by_model_path = Path(reports_by_model_dir)
+    repo_reports = _find_repo_reports(reports_by_model_path, repo_name, index)
+    print(f"Found {len(repo_reports)} reports for repository {repo_name}: {repo_reports}")
+    
+    if not repo_reports:
+        print(f"No reports found for repository: {repo_name}")
+        return False
+    
+    return _build_repo_outputs(repo_name, repo_reports, reports_by_model_path, reports_by_repo_dir,
+                               rubric_dir, rubric_cache)
+
+
+def _evaluate_dockerfile(dockerfile_path: str, relative_path: str, repo_name: str, report_path: str,
+                        rubric_dir: str, verbose: bool, skip_warnings: bool, legacy_subprocess: bool) -> bool:
+    """Announce and run the evaluation of a single dockerfile."""
+    print(f"🔄 Evaluating: {relative_path}")
+    # Collect the result messages and print them in one write, so the results
+    # of concurrent evaluations don't interleave
+    _install_output_router()
+    block = io.StringIO()
+    _thread_output.buffer = block
+    try:
+        success = run_evaluation(dockerfile_path, repo_name, report_path, rubric_dir, verbose, skip_warnings,
+                                 legacy_subprocess)
+        print()
+    finally:
+        _thread_output.buffer = None
+    sys.stdout.write(block.getvalue())
+    return success
 
 
 def evaluate_single_repo(repo_name: str, baseline_dir: str, reports_by_model_dir: str, 
                          reports_by_repo_dir: str, rubric_dir: str, skip_existing: bool, 
-                         summary_only: bool, skip_warnings: bool, verbose: bool) -> Dict[str, int]:
+                         summary_only: bool, skip_warnings: bool, verbose: bool,
+                         jobs: int = 1, legacy_subprocess: bool = False,
+                         report_index: Optional[Dict[str, List[Path]]] = None,
+                         rubric_cache: bool = False) -> Dict[str, int]:
     """
     Evaluate a single repository.
     
@@ -699,6 +1098,10 @@ def evaluate_single_repo(repo_name: str, baseline_dir: str, reports_by_model_dir
         summary_only: Only create repo summary (skip individual evaluations)
         skip_warnings: Skip user confirmation prompts
         verbose: Enable verbose output
+        jobs: Number of dockerfiles to evaluate concurrently
+        legacy_subprocess: Run each evaluation in a separate DockerfileEvaluator.py process
+        report_index: Prebuilt repo -> report paths mapping, used in summary-only mode
+        rubric_cache: Reuse derived rubric metadata cached on disk by earlier runs
         
     Returns:
         Dictionary with evaluation statistics: {'successful': int, 'failed': int, 'skipped': int}
@@ -710,7 +1113,8 @@ def evaluate_single_repo(repo_name: str, baseline_dir: str, reports_by_model_dir
     # If summary-only mode, just create the repo summary
     if summary_only:
         print("Creating repository summary from existing reports...")
-        success = create_repo_summary(repo_name, reports_by_model_dir, reports_by_repo_dir, rubric_dir)
+        success = create_repo_summary(repo_name, reports_by_model_dir, reports_by_repo_dir, rubric_dir,
+                                      report_index, rubric_cache)
         return {'successful': 1 if success else 0, 'failed': 0 if success else 1, 'skipped': 0}
     
     # Find all dockerfiles for the repo
@@ -734,6 +1138,7 @@ def evaluate_single_repo(repo_name: str, baseline_dir: str, reports_by_model_dir
     skipped = 0
     failed = 0
     
+    pending = []
     for dockerfile_path, relative_path in dockerfiles:
         # Create corresponding report path
         report_path = create_report_path(relative_path, reports_by_model_dir)
@@ -744,17 +1149,34 @@ def evaluate_single_repo(repo_name: str, baseline_dir: str, reports_by_model_dir
             skipped += 1
             continue
         
-        # Run evaluation
-        print(f"🔄 Evaluating: {relative_path}")
-        if run_evaluation(dockerfile_path, repo_name, report_path, rubric_dir, verbose, skip_warnings):
-            successful += 1
-        else:
-            failed += 1
-        print()
+        pending.append((dockerfile_path, relative_path, report_path))
+    
+    # Each evaluation is an independent, blocking docker build + test run,
+    # so they can be dispatched concurrently on threads
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [
+            executor.submit(_evaluate_dockerfile, dockerfile_path, relative_path, repo_name,
+                            report_path, rubric_dir, verbose, skip_warnings, legacy_subprocess)
+            for dockerfile_path, relative_path, report_path in pending
+        ]
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    successful += 1
+                else:
+                    failed += 1
+        except KeyboardInterrupt:
+            # Drop the queued evaluations; running ones stop after their current
+            # step and remove their Docker resources before the executor exits
+            print("\nInterrupted: cancelling remaining evaluations and cleaning up...")
+            executor.shutdown(wait=False, cancel_futures=True)
+            cancel_running_evaluations()
+            raise
     
     # Create repository summary
     print("Creating repository summary...")
-    summary_success = create_repo_summary(repo_name, reports_by_model_dir, reports_by_repo_dir, rubric_dir)
+    summary_success = create_repo_summary(repo_name, reports_by_model_dir, reports_by_repo_dir, rubric_dir,
+                                          rubric_cache=rubric_cache)
     
     # Print summary for this repo
     print(f"\nRepository: {repo_name}")
@@ -774,6 +1196,32 @@ def evaluate_single_repo(repo_name: str, baseline_dir: str, reports_by_model_dir
     return {'successful': successful, 'failed': failed, 'skipped': skipped}
 
 
+def _write_overall_summary_md(md_path: str, overall_summary: Dict[str, Any], repos: List[str],
+                              repo_stats: Dict[str, Dict[str, int]]) -> None:
+    """Write the markdown overall summary for multiple repositories."""
+    with open(md_path, 'w') as f:
+        f.write("# Overall Batch Evaluation Summary\n\n")
+        f.write(f"**Timestamp:** {overall_summary['timestamp']}\n\n")
+        f.write(f"**Total Repositories:** {len(repos)}\n")
+        f.write(f"**Total Dockerfiles:** {overall_summary['total_dockerfiles']}\n")
+        f.write(f"**Success Rate:** {overall_summary['success_rate']}%\n\n")
+        
+        f.write("## Repository Breakdown\n\n")
+        f.write("| Repository | Successful | Failed | Skipped | Total |\n")
+        f.write("|------------|------------|--------|---------|-------|\n")
+        
+        # Shared zero entry for repos without stats (not written back into repo_stats,
+        # which is also serialized as repository_details)
+        zero_stats = {'successful': 0, 'failed': 0, 'skipped': 0}
+        for repo in repos:
+            stats = repo_stats.get(repo, zero_stats)
+            successful = stats['successful']
+            failed = stats['failed']
+            skipped = stats['skipped']
+            total = successful + failed + skipped
+            f.write(f"| {repo} | {successful} | {failed} | {skipped} | {total} |\n")
+
+
 def create_overall_summary(repos: List[str], repo_stats: Dict[str, Dict[str, int]], 
                           reports_by_repo_dir: str) -> None:
     """
@@ -804,28 +1252,13 @@ def create_overall_summary(repos: List[str], repo_stats: Dict[str, Dict[str, int
         'repository_details': repo_stats
     }
     
-    # Save overall summary
-    summary_path = Path(reports_by_repo_dir) / "overall_summary.json"
-    with open(summary_path, 'w') as f:
-        json.dump(overall_summary, f, indent=2)
-    
-    # Create markdown summary
-    md_path = Path(reports_by_repo_dir) / "overall_summary.md"
-    with open(md_path, 'w') as f:
-        f.write("# Overall Batch Evaluation Summary\n\n")
-        f.write(f"**Timestamp:** {overall_summary['timestamp']}\n\n")
-        f.write(f"**Total Repositories:** {len(repos)}\n")
-        f.write(f"**Total Dockerfiles:** {total_dockerfiles}\n")
-        f.write(f"**Success Rate:** {overall_summary['success_rate']}%\n\n")
-        
-        f.write("## Repository Breakdown\n\n")
-        f.write("| Repository | Successful | Failed | Skipped | Total |\n")
-        f.write("|------------|------------|--------|---------|-------|\n")
-        
-        for repo in repos:
-            stats = repo_stats.get(repo, {'successful': 0, 'failed': 0, 'skipped': 0})
-            total = stats['successful'] + stats['failed'] + stats['skipped']
-            f.write(f"| {repo} | {stats['successful']} | {stats['failed']} | {stats['skipped']} | {total} |\n")
+    # Save overall summary (JSON and markdown concurrently)
+    summary_path = os.path.join(reports_by_repo_dir, "overall_summary.json")
+    md_path = os.path.join(reports_by_repo_dir, "overall_summary.md")
+    _run_writers_concurrently(
+        (write_json, summary_path, overall_summary),
+        (_write_overall_summary_md, md_path, overall_summary, repos, repo_stats),
+    )
     
     print(f"\nOverall summary saved to: {summary_path}")
     print(f"Overall markdown summary: {md_path}")
@@ -860,6 +1293,12 @@ def main():
                        help="Skip user confirmation prompts for potentially destructive operations, turn on with caution!")
     parser.add_argument("--verbose", action="store_true", 
                        help="Enable verbose output")
+    parser.add_argument("--jobs", type=int, default=1,
+                       help="Number of dockerfiles to evaluate concurrently per repository (default: 1)")
+    parser.add_argument("--legacy-subprocess", action="store_true",
+                       help="Run each evaluation in a separate DockerfileEvaluator.py process instead of in-process")
+    parser.add_argument("--rubric-cache", action="store_true",
+                       help=f"Cache derived rubric test metadata under <rubric-dir>/{RUBRIC_CACHE_DIR} and reuse it across runs")
     
     args = parser.parse_args()
     
@@ -919,6 +1358,12 @@ def main():
     print(f"Reports by repo: {args.reports_by_repo_dir}")
     print("-" * 60)
     
+    # In summary-only mode the reports tree does not change during the run,
+    # so walk it once and serve every repository from the same index
+    report_index = None
+    if args.summary_only and len(repos_to_evaluate) > 1:
+        report_index = _index_reports(Path(args.reports_by_model_dir))
+    
     # Evaluate each repository
     repo_stats = {}
     overall_successful = 0
@@ -931,7 +1376,8 @@ def main():
         stats = evaluate_single_repo(
             repo_name, args.baseline_dir, args.reports_by_model_dir,
             args.reports_by_repo_dir, args.rubric_dir, args.skip_existing,
-            args.summary_only, args.skip_warnings, args.verbose
+            args.summary_only, args.skip_warnings, args.verbose, args.jobs,
+            args.legacy_subprocess, report_index, args.rubric_cache
         )
         
         repo_stats[repo_name] = stats
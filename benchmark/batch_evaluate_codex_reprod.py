@@ -1,25 +1,156 @@
+import argparse
+import contextlib
+import io
 import subprocess
 import json
 import os
 import sys
 import csv
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Tuple, Dict, Any, Optional
 
 from DockerfileEvaluator import DockerfileEvaluator
+from json_io import write_json
 
-def get_report_filename(repo_name: str) -> Path:
+def get_report_filename(repo_name: str, report_dir: Optional[Path] = None) -> Path:
     report_file = "codex-gpt41mini_report.json"
-    return Path(__file__).parent / "reports-by-repo" / repo_name / report_file
+    if report_dir is None:
+        report_dir = Path(__file__).parent / "reports-by-repo"
+    return report_dir / repo_name / report_file
+
+def _run_one(repo_path: Path, rubric_dir: Path, report_dir: Path, skip_warnings: bool,
+             capture_output: bool = False) -> Tuple[str, bool, str]:
+    """
+    Evaluate one repo's codex.dockerfile and save its report.
+
+    May run in a worker process, so everything it needs is passed in explicitly.
+
+    Args:
+        capture_output: Collect everything printed and return it instead of printing
+            it as it happens, so output from concurrent repos doesn't interleave
+
+    Returns:
+        Tuple of (repo_name, any_failures, captured_output)
+    """
+    if not capture_output:
+        repo_name, any_failures = _evaluate_repo(repo_path, rubric_dir, report_dir, skip_warnings)
+        return repo_name, any_failures, ""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        repo_name, any_failures = _evaluate_repo(repo_path, rubric_dir, report_dir, skip_warnings)
+    return repo_name, any_failures, output.getvalue()
+
+def _evaluate_repo(repo_path: Path, rubric_dir: Path, report_dir: Path, skip_warnings: bool) -> Tuple[str, bool]:
+    """
+    Evaluate one repo's codex.dockerfile and save its report.
+
+    Returns:
+        Tuple of (repo_name, any_failures)
+    """
+    repo_name = repo_path.name
+    dockerfile_path = repo_path / "codex.dockerfile"
+    print(f"\nEvaluating repo: {repo_name}")
+    any_failures = False
+
+    # Create the per-repo report dirs once, before anything is saved into them
+    repo_models_dir = report_dir / repo_name / "models"
+    repo_models_dir.mkdir(parents=True, exist_ok=True)
+
+    evaluator = DockerfileEvaluator(repo_name, str(dockerfile_path), str(rubric_dir), skip_warnings)
+    report = None
+    error_messages = []
+
+    try:
+        report = evaluator.evaluate()
+    except KeyboardInterrupt:
+        print("Evaluation interrupted by user")
+        error_messages.append("Evaluation interrupted by user (KeyboardInterrupt)")
+        try:
+            report = evaluator.generate_report()
+        except Exception as gen_ex:
+            error_messages.append(f"Failed to generate report after interrupt: {gen_ex}")
+            report = {"repo": repo_name, "errors": error_messages}
+        
+        # Save partial report before exiting
+        out_file = get_report_filename(repo_name, report_dir)
+        try:
+            if report:
+                if isinstance(report, dict) and 'errors' not in report:
+                    report['errors'] = error_messages
+                write_json(out_file, report)
+                print(f"Saved partial report -> {out_file}")
+        except Exception as save_ex:
+            print(f"Failed to save partial report: {save_ex}")
+        
+        try:
+            evaluator.cleanup()
+        except Exception:
+            pass
+        # Let the parent process stop the remaining workers and exit
+        raise
+    except Exception as e:
+        error_msg = f"Evaluation raised exception: {type(e).__name__}: {e}"
+        print(f"Evaluation for {repo_name} raised an exception: {e}")
+        error_messages.append(error_msg)
+        try:
+            report = evaluator.generate_report()
+        except Exception as gen_ex:
+            error_messages.append(f"Failed to generate report after error: {gen_ex}")
+            report = {"repo": repo_name, "errors": error_messages}
+        any_failures = True
+
+    # Append any error messages to the report
+    if error_messages and report:
+        if isinstance(report, dict):
+            if 'errors' not in report:
+                report['errors'] = []
+            report['errors'].extend(error_messages)
+
+    # Save report (always, even partial)
+    #out_file = report_dir / f"{repo_name}.json"
+    out_file = repo_models_dir / "codex-gpt41mini_report.json"
+    try:
+        if report:
+            write_json(out_file, report)
+            print(f"Saved report -> {out_file}")
+        else:
+            # Create minimal error report if no report exists
+            error_report = {"repo": repo_name, "errors": error_messages or ["Unknown error: no report generated"]}
+            write_json(out_file, error_report)
+            print(f"Saved error report -> {out_file}")
+            any_failures = True
+    except Exception as e:
+        print(f"Failed to save report for {repo_name}: {e}")
+        any_failures = True
+
+    # Determine if this repo had failing tests
+    try:
+        summary = report.get('summary', {}) if isinstance(report, dict) else {}
+        failed_tests = summary.get('failed_tests', 0)
+        if failed_tests and failed_tests > 0:
+            any_failures = True
+    except Exception:
+        any_failures = True
+
+    return repo_name, any_failures
 
 def main():
-    # Built-in defaults (no CLI args)
+    parser = argparse.ArgumentParser(description="Evaluate the codex baseline dockerfiles")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of repositories to evaluate concurrently (default: 1). Each one runs "
+                             "its own Docker build and container, so keep this small")
+    args = parser.parse_args()
+
+    # Built-in defaults
     baseline_output = Path(__file__).parent / "Baseline-codex-with-traj" / "output"
     rubric_dir = Path(__file__).parent / "rubrics" / "manual"
     report_dir = Path(__file__).parent / "reports-by-repo"
     
     skip_warnings = False
     verbose = False
+    max_workers = max(1, args.jobs)
 
     # 1. Verify baseline output dir exists
     if not baseline_output.exists() or not baseline_output.is_dir():
@@ -56,95 +187,33 @@ def main():
         print("WARNING: One or more required files are missing. Aborting.")
         #raise Exception("One or more required files are missing. Aborting.")
 
-    # Ensure report dir existss
+    # Ensure report dir exists
     report_dir.mkdir(parents=True, exist_ok=True)
 
     any_failures = False
     results_summary = []
 
-    # 4. Evaluate each dockerfile
-    for repo_path in repos:
-        repo_name = repo_path.name
-        dockerfile_path = repo_path / "codex.dockerfile"
-        print(f"\nEvaluating repo: {repo_name}")
-
-        evaluator = DockerfileEvaluator(repo_name, str(dockerfile_path), str(rubric_dir), skip_warnings)
-        report = None
-        error_messages = []
-
-        try:
-            report = evaluator.evaluate()
-        except KeyboardInterrupt:
-            print("Evaluation interrupted by user")
-            error_messages.append("Evaluation interrupted by user (KeyboardInterrupt)")
-            try:
-                report = evaluator.generate_report()
-            except Exception as gen_ex:
-                error_messages.append(f"Failed to generate report after interrupt: {gen_ex}")
-                report = {"repo": repo_name, "errors": error_messages}
-            
-            # Save partial report before exiting
-            out_file = get_report_filename(repo_name)
+    # 4. Evaluate each dockerfile, one repo per worker process with --jobs > 1;
+    # worker output is buffered and printed per repo, in repo order
+    capture_output = max_workers > 1
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) if capture_output else contextlib.nullcontext() as executor:
+            map_fn = executor.map if executor is not None else map
             try:
-                if report:
-                    if isinstance(report, dict) and 'errors' not in report:
-                        report['errors'] = error_messages
-                    with open(out_file, 'w', encoding='utf-8') as f:
-                        json.dump(report, f, indent=2)
-                    print(f"Saved partial report -> {out_file}")
-            except Exception as save_ex:
-                print(f"Failed to save partial report: {save_ex}")
-            
-            try:
-                evaluator.cleanup()
-            except Exception:
-                pass
-            sys.exit(130)
-        except Exception as e:
-            error_msg = f"Evaluation raised exception: {type(e).__name__}: {e}"
-            print(f"Evaluation for {repo_name} raised an exception: {e}")
-            error_messages.append(error_msg)
-            try:
-                report = evaluator.generate_report()
-            except Exception as gen_ex:
-                error_messages.append(f"Failed to generate report after error: {gen_ex}")
-                report = {"repo": repo_name, "errors": error_messages}
-            any_failures = True
-
-        # Append any error messages to the report
-        if error_messages and report:
-            if isinstance(report, dict):
-                if 'errors' not in report:
-                    report['errors'] = []
-                report['errors'].extend(error_messages)
-
-        # Save report (always, even partial)
-        #out_file = report_dir / f"{repo_name}.json"
-        out_file = report_dir / repo_name / "models" / "codex-gpt41mini_report.json"
-        try:
-            if report:
-                with open(out_file, 'w', encoding='utf-8') as f:
-                    json.dump(report, f, indent=2)
-                print(f"Saved report -> {out_file}")
-            else:
-                # Create minimal error report if no report exists
-                error_report = {"repo": repo_name, "errors": error_messages or ["Unknown error: no report generated"]}
-                with open(out_file, 'w', encoding='utf-8') as f:
-                    json.dump(error_report, f, indent=2)
-                print(f"Saved error report -> {out_file}")
-                any_failures = True
-        except Exception as e:
-            print(f"Failed to save report for {repo_name}: {e}")
-            any_failures = True
-
-        # Determine if this repo had failing tests
-        try:
-            summary = report.get('summary', {}) if isinstance(report, dict) else {}
-            failed_tests = summary.get('failed_tests', 0)
-            if failed_tests and failed_tests > 0:
-                any_failures = True
-        except Exception:
-            any_failures = True
+                for repo_name, repo_failed, repo_output in map_fn(
+                        _run_one, repos, repeat(rubric_dir), repeat(report_dir), repeat(skip_warnings),
+                        repeat(capture_output)):
+                    sys.stdout.write(repo_output)
+                    results_summary.append((repo_name, repo_failed))
+                    if repo_failed:
+                        any_failures = True
+            except (KeyboardInterrupt, CancelledError):
+                if executor is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                raise KeyboardInterrupt
+    except KeyboardInterrupt:
+        print("Evaluation interrupted by user")
+        sys.exit(130)
 
     # 5. Exit code
     if any_failures:
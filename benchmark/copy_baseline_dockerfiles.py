@@ -4,12 +4,58 @@ Script to copy dockerfiles from Baseline-codex-with-traj to ENVGYM-baseline.
 Validates that source files exist and target directories exist before copying.
 """
 
+import argparse
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import sys
 
+def _fast_copy(source_path: Path, target_path: Path) -> None:
+    """
+    Copy a file and its metadata like shutil.copy2, moving the data with
+    os.sendfile in the kernel where supported.
+    
+    Falls back to shutil.copy2 on platforms without file-to-file sendfile
+    (e.g. macOS, Windows) or if the fast path fails.
+    """
+    if not hasattr(os, "sendfile"):
+        shutil.copy2(source_path, target_path)
+        return
+    
+    try:
+        src_fd = os.open(source_path, os.O_RDONLY)
+        try:
+            dst_fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                blocksize = max(os.fstat(src_fd).st_size, 1024 * 1024)
+                offset = 0
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, offset, blocksize)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        shutil.copystat(source_path, target_path)
+    except OSError:
+        shutil.copy2(source_path, target_path)
+
+def _copy_one(baseline_dir: Path, target_base_dir: Path, repo_name: str) -> str:
+    """Copy one repo's codex.dockerfile to its envgym.dockerfile target."""
+    source_path = baseline_dir / repo_name / "codex.dockerfile"
+    target_path = target_base_dir / repo_name / "envgym.dockerfile"
+    _fast_copy(source_path, target_path)
+    return repo_name
+
 def main():
+    parser = argparse.ArgumentParser(description="Copy codex dockerfiles into ENVGYM-baseline")
+    parser.add_argument("--max-concurrency", type=int, default=8,
+                        help="Maximum number of dockerfiles to copy concurrently (default: 8)")
+    args = parser.parse_args()
+    
     # Define base paths
     baseline_dir = Path("Baseline-codex-with-traj/output")
     target_base_dir = Path("ENVGYM-baseline/codex/gpt41mini")
@@ -23,22 +69,26 @@ def main():
         print(f"ERROR: Target base directory does not exist: {target_base_dir}")
         sys.exit(1)
     
-    # Get all repo_names from baseline output
-    repo_names = [d.name for d in baseline_dir.iterdir() if d.is_dir()]
-    
-    print(f"Found {len(repo_names)} repositories in Baseline-codex-with-traj/output")
-    print()
-    
-    # Step 1: Check which repos have dockerfiles
+    # Step 1: One pass over the baseline output collects repo names and
+    # classifies them by whether they have a dockerfile
+    repo_names = []
     missing_dockerfile = []
     has_dockerfile = []
     
-    for repo_name in repo_names:
-        dockerfile_path = baseline_dir / repo_name / "codex.dockerfile"
-        if not dockerfile_path.exists():
-            missing_dockerfile.append(repo_name)
-        else:
-            has_dockerfile.append(repo_name)
+    with os.scandir(baseline_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            repo_names.append(entry.name)
+            try:
+                os.stat(os.path.join(entry.path, "codex.dockerfile"))
+            except FileNotFoundError:
+                missing_dockerfile.append(entry.name)
+            else:
+                has_dockerfile.append(entry.name)
+    
+    print(f"Found {len(repo_names)} repositories in Baseline-codex-with-traj/output")
+    print()
     
     # Report missing dockerfiles
     if missing_dockerfile:
@@ -51,12 +101,10 @@ def main():
     print()
     
     # Step 2: Verify target directories exist for repos with dockerfiles
-    target_missing = []
-    
-    for repo_name in has_dockerfile:
-        target_dir = target_base_dir / repo_name
-        if not target_dir.exists():
-            target_missing.append(repo_name)
+    # (list the target base once rather than stat'ing each target directory)
+    with os.scandir(target_base_dir) as entries:
+        target_names = {entry.name for entry in entries}
+    target_missing = [repo_name for repo_name in has_dockerfile if repo_name not in target_names]
     
     if target_missing:
         print(f"ERROR: {len(target_missing)} repositories have dockerfiles but target directory missing:")
@@ -74,17 +122,22 @@ def main():
     copied_count = 0
     failed_count = 0
     
-    for repo_name in has_dockerfile:
-        source_path = baseline_dir / repo_name / "codex.dockerfile"
-        target_path = target_base_dir / repo_name / "envgym.dockerfile"
-        
-        try:
-            shutil.copy2(source_path, target_path)
-            copied_count += 1
-            print(f"  ✓ {repo_name}")
-        except Exception as e:
-            failed_count += 1
-            print(f"  ✗ {repo_name}: {e}")
+    # Copies are independent and I/O bound, so overlap them on a thread pool
+    max_workers = max(1, min(args.max_concurrency, len(has_dockerfile)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_copy_one, baseline_dir, target_base_dir, repo_name): repo_name
+            for repo_name in has_dockerfile
+        }
+        for future in as_completed(futures):
+            repo_name = futures[future]
+            try:
+                future.result()
+                copied_count += 1
+                print(f"  ✓ {repo_name}")
+            except Exception as e:
+                failed_count += 1
+                print(f"  ✗ {repo_name}: {e}")
     
     print()
     print("=" * 60)
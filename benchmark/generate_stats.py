@@ -11,13 +11,72 @@ Usage:
 """
 
 import argparse
-import json
+import contextlib
+import io
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-import matplotlib.pyplot as plt
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 import numpy as np
-from collections import defaultdict
+
+from json_io import PARAMS_DIGEST_VERSION, params_digest, read_json, write_json
+
+# matplotlib.pyplot, imported by _lazy_plt() only once there is something to plot,
+# so --help and the early-exit paths don't pay for loading it
+plt = None
+
+# Rubric test categories, in reporting order
+CATEGORIES = ('structure', 'configuration', 'functionality')
+CAT_INDEX = {category: i for i, category in enumerate(CATEGORIES)}
+CAT_COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1')
+
+# Chart output: on-screen resolution by default, and fast PNG compression
+# (files are slightly larger but encode much faster than zlib's default level)
+DEFAULT_DPI = 150
+PNG_SAVE_KWARGS = {'compress_level': 1}
+
+# Model identifiers paired up as (baseline, "ours") in the comparison charts
+PAIR_TARGETS = ["opus4", "35haiku", "gpt41", "gpt41mini"]
+
+# Part of every parsed-report cache key, along with the params_digest scheme that
+# generated test ids come from; bump it whenever parsing or the cached data changes
+CACHE_VERSION = 1
+
+# Models whose per-repo category percentages are printed with --verbose
+_DEBUG_MODELS = frozenset({"ours-deepseek-deepseek-v3-0324"})
+
+
+def _lazy_plt() -> Any:
+    """Import and configure matplotlib.pyplot on first use and return it."""
+    global plt
+    if plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Charts are only written to files, so skip GUI backend setup
+        import matplotlib.pyplot as pyplot
+        pyplot.ioff()  # Don't redraw after each pyplot call, even if matplotlibrc enables interactive mode
+        plt = pyplot
+    return plt
+
+
+@lru_cache(maxsize=None)
+def _read_json_cached(path: str, file_key: Tuple[int, int]) -> Any:
+    return read_json(path)
+
+
+def load_json_cached(path: Path) -> Any:
+    """
+    Read a JSON file through a per-process cache keyed by path, mtime and size.
+    
+    Charts and summaries revisit the same reports and rubrics several times per
+    run; only the first visit touches the disk. The returned object is shared
+    between callers and must be treated as read-only.
+    """
+    return _read_json_cached(os.path.abspath(path), _file_key(path))
 
 
 def discover_available_repos(reports_dir: str = "reports-by-repo") -> List[str]:
@@ -35,28 +94,34 @@ def discover_available_repos(reports_dir: str = "reports-by-repo") -> List[str]:
         return []
     
     repos = []
-    for repo_dir in reports_path.iterdir():
-        if repo_dir.is_dir() and (repo_dir / "models").exists():
-            # Check if there are any model reports
-            models_dir = repo_dir / "models"
-            if any(f.suffix == '.json' for f in models_dir.iterdir()):
-                repos.append(repo_dir.name)
+    with os.scandir(reports_path) as repo_entries:
+        for repo_entry in repo_entries:
+            # Directory type comes from the dirent, so no extra stat per repo
+            if not repo_entry.is_dir():
+                continue
+            
+            # Check if there are any model reports, stopping at the first one
+            try:
+                with os.scandir(os.path.join(repo_entry.path, "models")) as model_entries:
+                    if any(os.path.splitext(entry.name)[1] == '.json' for entry in model_entries):
+                        repos.append(repo_entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
     
     return sorted(repos)
 
 
-def load_rubric_categories(repo_name: str, rubrics_dir: str = "rubrics/manual") -> Tuple[Dict[str, str], Dict[str, int]]:
+def load_rubric_categories(repo_name: str, rubrics_dir: str = "rubrics/manual") -> Dict[str, Tuple[int, int, str]]:
     """
-    Load rubric file and extract test_id to category mapping and max scores.
+    Load rubric file and extract a test_id lookup of category and max score.
     
     Args:
         repo_name: Repository name
         rubrics_dir: Directory containing rubric files
         
     Returns:
-        Tuple of (categories_dict, max_scores_dict) where:
-        - categories_dict maps test_id to category
-        - max_scores_dict maps test_id to maximum possible score
+        Dictionary mapping test_id to (category_index, max_score, category), where
+        category_index indexes CATEGORIES (-1 for any other category)
         
     Raises:
         FileNotFoundError: If rubric file doesn't exist
@@ -67,12 +132,21 @@ def load_rubric_categories(repo_name: str, rubrics_dir: str = "rubrics/manual")
     if not rubric_path.exists():
         raise FileNotFoundError(f"Rubric file not found: {rubric_path}. ")
     
+    return _build_rubric_lookup(str(rubric_path.resolve()), _file_key(rubric_path))
+
+
+@lru_cache(maxsize=None)
+def _build_rubric_lookup(rubric_path: str, file_key: Tuple[int, int]) -> Dict[str, Tuple[int, int, str]]:
+    """
+    Build the test_id lookup for one rubric file, memoized per file version.
+    
+    file_key is the rubric's (mtime_ns, size), so an edited rubric is reloaded.
+    The returned dictionary is shared between callers and must not be modified.
+    """
     try:
-        with open(rubric_path, 'r') as f:
-            rubric = json.load(f)
+        rubric = load_json_cached(rubric_path)
         
-        categories = {}
-        max_scores = {}
+        lookup = {}
         
         for test in rubric.get('tests', []):
             test_id = test.get('id')
@@ -80,20 +154,18 @@ def load_rubric_categories(repo_name: str, rubrics_dir: str = "rubrics/manual")
             score = test.get('score', 1)
             
             if test_id and category and score is not None:
-                categories[test_id] = category
-                max_scores[test_id] = score
+                lookup[test_id] = (CAT_INDEX.get(category, -1), score, category)
             elif not test_id:
                 # Generate test_id for tests without explicit id
                 test_type = test.get('type', 'unknown')
-                params_hash = hash(str(test.get('params', {})))
+                params_hash = params_digest(test.get('params') or {})
                 generated_id = f"{test_type}_{params_hash}"
                 if category and score is not None:
-                    categories[generated_id] = category
-                    max_scores[generated_id] = score
+                    lookup[generated_id] = (CAT_INDEX.get(category, -1), score, category)
             else:
                 raise ValueError(f"Invalid test entry in rubric: {test}, missing required fields. Got test_id: {test_id}, category: {category}, score: {score}")
                 
-        return categories, max_scores
+        return lookup
         
     except Exception as e:
         raise ValueError(f"Error loading rubric {rubric_path}: {e}")
@@ -117,63 +189,74 @@ def find_model_reports(repo_name: str, reports_base_dir: str = "reports-by-repo"
         return []
     
     model_reports = []
-    for report_file in repo_dir.glob("*_report.json"):
-        model_name = report_file.stem.replace("_report", "")
-        model_reports.append((model_name, report_file))
+    with os.scandir(repo_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith("_report.json") and entry.is_file():
+                model_name = name[:-len(".json")].replace("_report", "")
+                model_reports.append((model_name, repo_dir / name))
     
     return model_reports
 
 
-def parse_model_report(report_path: Path, categories: Dict[str, str], max_scores: Dict[str, int]) -> Dict[str, Any]:
+def parse_model_report(report_path: Path, lookup: Dict[str, Tuple[int, int, str]]) -> Dict[str, Any]:
     """
     Parse a model report and categorize test results.
     
     Args:
         report_path: Path to the report JSON file
-        categories: Mapping of test_id to category
-        max_scores: Mapping of test_id to maximum possible score
+        lookup: Mapping of test_id to (category_index, max_score, category) from load_rubric_categories
         
     Returns:
         Dictionary with parsed results by category
     """
     try:
-        with open(report_path, 'r') as f:
-            report = json.load(f)
+        report = load_json_cached(report_path)
     except Exception as e:
         print(f"Error reading report {report_path}: {e}")
         return {}
     
-    # Initialize category data
-    category_data = {
-        'structure': {'score': 0, 'max_score': 0, 'tests': 0, 'passed': 0},
-        'configuration': {'score': 0, 'max_score': 0, 'tests': 0, 'passed': 0},
-        'functionality': {'score': 0, 'max_score': 0, 'tests': 0, 'passed': 0}
-    }
-    
     # Parse test results
     test_results = report.get('test_results', [])
+    test_ids = [test_result.get('test_id', '') for test_result in test_results]
     
-    for test_result in test_results:
-        test_id = test_result.get('test_id', '')
-        actual_score = test_result.get('score', 0)
-        passed = test_result.get('passed', 0)
-        
-        # Determine category and max score from rubric
-        if test_id not in categories:
-            print(f"test id: {test_id}, categories:\n{categories}")
+    # Every test must have a category and max score in the rubric
+    test_info = []
+    for test_id in test_ids:
+        if test_id not in lookup:
+            print(f"test id: {test_id}, rubric lookup:\n{lookup}")
             raise ValueError(f"Category for test ID '{test_id}' not found in rubric for report {report_path}.")
-        if test_id not in max_scores:
-            print(f"test id: {test_id}, max_scores:\n{max_scores}")
-            raise ValueError(f"Max score for test ID '{test_id}' not found in rubric for report {report_path}.")
-
-        category = categories[test_id]
-        test_max_score = max_scores[test_id]
-        
-        if category in category_data:
-            category_data[category]['score'] += actual_score
-            category_data[category]['max_score'] += test_max_score  # Sum max scores from rubric
-            category_data[category]['tests'] += 1
-            category_data[category]['passed'] += (1 if passed else 0)
+        test_info.append(lookup[test_id])
+    
+    # Aggregate every per-test column in one pass: rows of `columns` are
+    # (score, max_score, score is float, max_score is float, passed), summed
+    # into one row per category; tests outside CATEGORIES are dropped
+    cat_idx = np.array([info[0] for info in test_info], dtype=np.intp).reshape(-1)
+    known = cat_idx >= 0
+    actual_scores = [test_result.get('score', 0) for test_result in test_results]
+    test_max_scores = [info[1] for info in test_info]  # Max scores from rubric
+    columns = np.array([
+        (score, max_score, isinstance(score, float), isinstance(max_score, float), 1 if test_result.get('passed', 0) else 0)
+        for score, max_score, test_result in zip(actual_scores, test_max_scores, test_results)
+    ], dtype=np.float64).reshape(-1, 5)
+    totals = np.zeros((len(CATEGORIES), 5))
+    np.add.at(totals, cat_idx[known], columns[known])
+    test_counts = np.bincount(cat_idx[known], minlength=len(CATEGORIES))
+    
+    # Keep integer totals as ints, as summing the raw values would
+    score_sums = [float(row[0]) if row[2] else int(row[0]) for row in totals]
+    max_score_sums = [float(row[1]) if row[3] else int(row[1]) for row in totals]
+    passed_counts = totals[:, 4]
+    
+    category_data = {
+        category: {
+            'score': score_sums[i],
+            'max_score': max_score_sums[i],
+            'tests': int(test_counts[i]),
+            'passed': int(passed_counts[i])
+        }
+        for i, category in enumerate(CATEGORIES)
+    }
     
     # Get summary data
     summary = report.get('summary', {})
@@ -187,95 +270,236 @@ def parse_model_report(report_path: Path, categories: Dict[str, str], max_scores
     }
 
 
-def calculate_model_stats(repos: List[str], reports_base_dir: str = "reports-by-repo", rubrics_dir: str = "rubrics/manual") -> Dict[str, Any]:
+def _file_key(path: Path) -> Tuple[int, int]:
+    """Return a (mtime_ns, size) key that changes whenever the file is rewritten."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_cached(cache_path: Path, key: Any) -> Any:
+    """Return the value pickled at cache_path if it was stored under key, else None."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, value = pickle.load(f)
+    except Exception:
+        return None
+    return value if cached_key == key else None
+
+
+def _store_cached(cache_path: Path, key: Any, value: Any) -> None:
+    """Pickle (key, value) to cache_path, replacing any previous entry atomically."""
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}")
+
+
+def _process_repo(repo: str, reports_base_dir: str, rubrics_dir: str,
+                  cache_dir: Optional[Path] = None) -> Tuple[str, Optional[List[Tuple[str, Dict[str, Any]]]], str]:
     """
-    Calculate comprehensive statistics for all models across given repositories.
+    Load a repository's rubric and parse all of its model reports.
+    
+    Runs in a worker process. Anything printed along the way is captured and
+    returned so the caller can replay it in repository order.
     
     Args:
-        repos: List of repository names
+        repo: Repository name
         reports_base_dir: Base directory for reports
         rubrics_dir: Directory containing rubric files
+        cache_dir: Directory for pickled rubric lookups and parsed reports, reused while
+            the source files' mtime and size and the cache format are unchanged
+            (None disables caching)
         
     Returns:
-        Dictionary with model statistics
+        Tuple of (repo, [(model_name, report_data), ...], captured_output), where the
+        report list is None if the rubric is missing or invalid
     """
-    model_stats = defaultdict(lambda: {
-        'repos': {}
-    })
-    
-    all_models = set()
-    
-    for repo in repos:
-        print(f"Processing repository: {repo}")
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        repo_cache_dir = None
+        rubric_key = None
+        lookup = None
+        rubric_path = Path(rubrics_dir) / f"{repo}.json"
+        if cache_dir is not None and rubric_path.exists():
+            repo_cache_dir = cache_dir / repo
+            repo_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Report keys include this, so a format change invalidates those too
+            rubric_key = (CACHE_VERSION, PARAMS_DIGEST_VERSION, _file_key(rubric_path))
+            lookup = _load_cached(repo_cache_dir / "rubric.pkl", rubric_key)
         
         # Load rubric categories and max scores
-        try:
-            categories, max_scores = load_rubric_categories(repo, rubrics_dir)
-        except (FileNotFoundError, ValueError) as e:
-            print(f"Error processing repository {repo}: {e}")
-            print(f"Skipping repository {repo} due to missing or invalid rubric.")
-            continue
-        
-        # Find model reports
-        model_reports = find_model_reports(repo, reports_base_dir)
-        
-        for model_name, report_path in model_reports:
-            all_models.add(model_name)
+        if lookup is None:
+            try:
+                lookup = load_rubric_categories(repo, rubrics_dir)
+            except (FileNotFoundError, ValueError) as e:
+                print(f"Error processing repository {repo}: {e}")
+                print(f"Skipping repository {repo} due to missing or invalid rubric.")
+                return repo, None, output.getvalue()
+            if repo_cache_dir is not None:
+                _store_cached(repo_cache_dir / "rubric.pkl", rubric_key, lookup)
+        
+        # Find and parse model reports, reusing cached results for unchanged reports
+        parsed_reports = []
+        for model_name, report_path in find_model_reports(repo, reports_base_dir):
+            report_data = None
+            if repo_cache_dir is not None:
+                report_key = (_file_key(report_path), rubric_key)
+                report_cache_path = repo_cache_dir / f"{model_name}.pkl"
+                report_data = _load_cached(report_cache_path, report_key)
             
-            # Parse report
-            report_data = parse_model_report(report_path, categories, max_scores)
+            if report_data is None:
+                report_data = parse_model_report(report_path, lookup)
+                if repo_cache_dir is not None and report_data:
+                    _store_cached(report_cache_path, report_key, report_data)
             
-            if not report_data:
-                continue
+            parsed_reports.append((model_name, report_data))
+    
+    return repo, parsed_reports, output.getvalue()
+
+
+@dataclass
+class StatsArrays:
+    """
+    Struct-of-arrays view of the model statistics shared by the chart functions.
+    
+    Attributes:
+        models: Model names, in model_stats order
+        repos: Repository names, in analysis order
+        cat_pct: Per-repo category percentages, shape (models, repos, categories);
+            0 where the model has no report for the repo or the category has no max score
+        overall_pct: Average overall percentage per model, shape (models,)
+        cat_pct_mean: Average category percentages per model, shape (models, categories)
+    """
+    models: List[str]
+    repos: List[str]
+    cat_pct: np.ndarray
+    overall_pct: np.ndarray
+    cat_pct_mean: np.ndarray
+    
+    @property
+    def error_pct(self) -> np.ndarray:
+        """Average percentage points lost per category, shape (models, categories)."""
+        return 100 - self.cat_pct_mean
+
+
+def calculate_model_stats(repos: List[str], reports_base_dir: str = "reports-by-repo", rubrics_dir: str = "rubrics/manual",
+                          verbose: bool = False, cache_dir: Optional[Path] = None) -> Tuple[Dict[str, Any], StatsArrays]:
+    """
+    Calculate comprehensive statistics for all models across given repositories.
+    
+    Args:
+        repos: List of repository names
+        reports_base_dir: Base directory for reports
+        rubrics_dir: Directory containing rubric files
+        verbose: Print per-repo category percentages for the models in _DEBUG_MODELS
+        cache_dir: Directory for cached rubric lookups and parsed reports (None disables caching)
+        
+    Returns:
+        Tuple of (dictionary with model statistics, the same statistics as StatsArrays for the charts)
+    """
+    model_stats: Dict[str, Dict[str, Any]] = {}
+    
+    # Rubric loading and report parsing are independent per repository, so run
+    # them in worker processes and merge the results back in repository order.
+    # No more workers than repositories, and none at all with one CPU or repo.
+    n_workers = min(os.cpu_count() or 1, len(repos))
+    with ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1 else contextlib.nullcontext() as executor:
+        map_fn = executor.map if executor is not None else map
+        for repo, parsed_reports, repo_output in map_fn(
+                _process_repo, repos, repeat(reports_base_dir), repeat(rubrics_dir), repeat(cache_dir)):
+            print(f"Processing repository: {repo}")
+            sys.stdout.write(repo_output)
             
-            # Store repo-specific data
-            model_stats[model_name]['repos'][repo] = report_data
+            if parsed_reports is None:
+                continue
             
-            # No need to "add to totals" - we'll calculate averages from repo-specific data later
+            for model_name, report_data in parsed_reports:
+                # Every model gets an entry, even if none of its reports parsed
+                model_repos = model_stats.setdefault(model_name, {'repos': {}})['repos']
+                
+                if not report_data:
+                    continue
+                
+                # Store repo-specific data
+                model_repos[repo] = report_data
+                
+                # No need to "add to totals" - we'll calculate averages from repo-specific data later
+    
+    # Lay the per-repo totals out as (model, repo[, category]) arrays so all
+    # percentages come from one broadcast divide
+    model_names = list(model_stats)
+    repo_index = {repo: j for j, repo in enumerate(repos)}
+    n_models, n_repos, n_categories = len(model_names), len(repos), len(CATEGORIES)
+    has_repo = np.zeros((n_models, n_repos), dtype=bool)
+    total_scores = np.zeros((n_models, n_repos))
+    total_max_scores = np.zeros((n_models, n_repos))
+    category_scores = np.zeros((n_models, n_repos, n_categories))
+    category_max_scores = np.zeros((n_models, n_repos, n_categories))
+    
+    for i, model_name in enumerate(model_names):
+        for repo, repo_data in model_stats[model_name]['repos'].items():
+            j = repo_index[repo]
+            has_repo[i, j] = True
+            total_scores[i, j] = repo_data['total_score']
+            total_max_scores[i, j] = repo_data['total_max_score']
+            for c, category in enumerate(CATEGORIES):
+                cat_data = repo_data['category_data'][category]
+                category_scores[i, j, c] = cat_data['score']
+                category_max_scores[i, j, c] = cat_data['max_score']
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        repo_percentages = np.where(total_max_scores > 0, (total_scores / total_max_scores) * 100, 0.0)
+        # If max_score is 0, treat as 0% (no tests in this category for this repo)
+        repo_category_percentages = np.where(category_max_scores > 0,
+                                             (category_scores / category_max_scores) * 100, 0.0)
+    
+    # Overall average only counts repos with a nonzero max score; category
+    # averages count every repo the model was evaluated on
+    overall_counts = (has_repo & (total_max_scores > 0)).sum(axis=1)
+    overall_sums = np.where(has_repo & (total_max_scores > 0), repo_percentages, 0.0).sum(axis=1)
+    repo_counts = has_repo.sum(axis=1)
+    category_sums = np.where(has_repo[:, :, np.newaxis], repo_category_percentages, 0.0).sum(axis=1)
+    overall_means = np.divide(overall_sums, overall_counts, out=np.zeros(n_models), where=overall_counts > 0)
+    category_means = np.divide(category_sums, repo_counts[:, np.newaxis], out=np.zeros((n_models, n_categories)),
+                               where=repo_counts[:, np.newaxis] > 0)
+    
+    debug_models = _DEBUG_MODELS if verbose else frozenset()
     
     # Calculate percentages by averaging across repositories
-    for model_name in all_models:
+    for i, model_name in enumerate(model_names):
         stats = model_stats[model_name]
         
-        # Calculate overall average percentage across repos
-        overall_percentages = []
-        for repo, repo_data in stats['repos'].items():
-            if repo_data['total_max_score'] > 0:
-                repo_percentage = (repo_data['total_score'] / repo_data['total_max_score']) * 100
-                overall_percentages.append(repo_percentage)
-        
-        stats['overall_percentage'] = sum(overall_percentages) / len(overall_percentages) if overall_percentages else 0
+        stats['overall_percentage'] = float(overall_means[i]) if overall_counts[i] else 0
         
-        # Calculate category percentages by averaging across repos
         stats['category_percentages'] = {}
-        for category in ['structure', 'configuration', 'functionality']:
-            category_percentages = []
-            for repo, repo_data in stats['repos'].items():
-                cat_data = repo_data['category_data'][category]
-                if cat_data['max_score'] > 0:
-                    repo_cat_percentage = (cat_data['score'] / cat_data['max_score']) * 100
-                    category_percentages.append(repo_cat_percentage)
-                else:
-                    # If max_score is 0, treat as 0% (no tests in this category for this repo)
-                    category_percentages.append(0)
-            if model_name == "ours-deepseek-deepseek-v3-0324":
+        for c, category in enumerate(CATEGORIES):
+            if model_name in debug_models:
+                category_percentages = repo_category_percentages[i, has_repo[i], c].tolist()
                 print(f"Debug: Percentage of score that {model_name} scored in per category, per repo.\nCategory: {category}, score percentages: {category_percentages}")
-            stats['category_percentages'][category] = (sum(category_percentages) / len(category_percentages) 
-                                                     if category_percentages else 0)
-    
-    return dict(model_stats)
+            stats['category_percentages'][category] = float(category_means[i, c]) if repo_counts[i] else 0
+    
+    # Repos without a report and categories without a max score are already 0 in these arrays
+    arrays = StatsArrays(
+        models=model_names,
+        repos=list(repos),
+        cat_pct=repo_category_percentages,
+        overall_pct=overall_means,
+        cat_pct_mean=category_means,
+    )
+    return model_stats, arrays
 
 
-def create_model_average_chart(model_stats: Dict[str, Any], output_dir: Path) -> None:
+def create_model_average_chart(arrays: StatsArrays, output_dir: Path, dpi: int = DEFAULT_DPI) -> None:
     """
     Create bar chart showing average percentage score for each model.
     """
     # Sort models by accuracy from worst to best (ascending order)
-    model_performance = [(model, stats['overall_percentage']) for model, stats in model_stats.items()]
-    model_performance.sort(key=lambda x: x[1])  # Sort by percentage (ascending)
-    
-    models = [item[0] for item in model_performance]
-    percentages = [item[1] for item in model_performance]
+    order = np.argsort(arrays.overall_pct, kind='stable')
+    models = [arrays.models[i] for i in order]
+    percentages = arrays.overall_pct[order]
     
     plt.figure(figsize=(12, 6))
     bars = plt.bar(models, percentages, color='steelblue', alpha=0.8)
@@ -294,82 +518,121 @@ def create_model_average_chart(model_stats: Dict[str, Any], output_dir: Path) ->
     plt.grid(axis='y', alpha=0.3)
     plt.tight_layout()
     
-    plt.savefig(output_dir / 'model_average_scores.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'model_average_scores.png', dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
     plt.close()
 
 
-def create_category_charts(model_stats: Dict[str, Any], output_dir: Path) -> None:
+def _prewarm_fonts() -> None:
+    """
+    Resolve and load the default regular and bold fonts once in this process.
+    
+    Chart workers forked afterwards inherit the loaded fonts instead of each
+    resolving them again on their first draw.
+    """
+    from matplotlib import font_manager
+    
+    for weight in ('normal', 'bold'):
+        font_manager.get_font(font_manager.findfont(font_manager.FontProperties(weight=weight)))
+
+
+def _reset_axes(fig: 'plt.Figure', ax: 'plt.Axes', subplot_params: Dict[str, float]) -> None:
+    """
+    Clear a reused chart's axes and restore the figure's original subplot layout.
+    
+    tight_layout() rewrites the figure's subplot params, so they are restored
+    before each redraw to lay every chart out exactly as on a fresh figure.
+    """
+    ax.clear()
+    fig.subplots_adjust(**subplot_params)
+
+
+def _render_in_workers(render_fn: Any, model_items: List[Tuple[str, Any]], *args: Any) -> None:
+    """
+    Render per-model charts, splitting the models across worker processes.
+    
+    Each worker gets an interleaved share of model_items and renders it with
+    render_fn(share, *args) on its own reused figure. With one CPU or one model
+    everything is rendered in this process.
+    """
+    n_workers = min(os.cpu_count() or 1, len(model_items))
+    if n_workers <= 1:
+        render_fn(model_items, *args)
+        return
+    
+    shares = [model_items[i::n_workers] for i in range(n_workers)]
+    # Workers that don't fork from this process (spawn/forkserver) import pyplot themselves
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_lazy_plt) as executor:
+        list(executor.map(render_fn, shares, *(repeat(arg) for arg in args)))
+
+
+def create_category_charts(arrays: StatsArrays, output_dir: Path, dpi: int = DEFAULT_DPI) -> None:
     """
     Create bar charts showing category performance for each model.
+    Charts are written to output_dir/<model_name>/, which must already exist.
     """
-    categories = ['structure', 'configuration', 'functionality']
+    _render_in_workers(_render_category_charts, list(zip(arrays.models, arrays.cat_pct_mean)), output_dir, dpi)
+
+
+def _render_category_charts(model_items: List[Tuple[str, np.ndarray]], output_dir: Path, dpi: int) -> None:
+    """Render category_performance.png for each (model_name, category percentages) in model_items."""
+    # One figure is reused for every model; only the axes are redrawn
+    fig, ax = plt.subplots(figsize=(10, 6))
+    subplot_params = vars(fig.subplotpars).copy()
     
-    for model_name, stats in model_stats.items():
+    for model_name, percentages in model_items:
         model_dir = output_dir / model_name
-        model_dir.mkdir(exist_ok=True)
         
-        percentages = [stats['category_percentages'][cat] for cat in categories]
-        
-        plt.figure(figsize=(10, 6))
-        bars = plt.bar(categories, percentages, 
-                      color=['#FF6B6B', '#4ECDC4', '#45B7D1'], alpha=0.8)
+        _reset_axes(fig, ax, subplot_params)
+        bars = ax.bar(CATEGORIES, percentages, color=CAT_COLORS, alpha=0.8)
         
         # Add value labels
         for bar, percentage in zip(bars, percentages):
             height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 1,
+            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
                     f'{percentage:.1f}%', ha='center', va='bottom')
         
-        plt.title(f'Category Performance - {model_name}', fontsize=16, fontweight='bold')
-        plt.xlabel('Category', fontsize=12)
-        plt.ylabel('Score Percentage (%)', fontsize=12)
-        plt.ylim(0, 100)
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
+        ax.set_title(f'Category Performance - {model_name}', fontsize=16, fontweight='bold')
+        ax.set_xlabel('Category', fontsize=12)
+        ax.set_ylabel('Score Percentage (%)', fontsize=12)
+        ax.set_ylim(0, 100)
+        ax.grid(axis='y', alpha=0.3)
+        fig.tight_layout()
         
-        plt.savefig(model_dir / 'category_performance.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(model_dir / 'category_performance.png', dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
+    
+    plt.close(fig)
 
 
-def create_comprehensive_category_chart(model_stats: Dict[str, Any], repos: List[str], 
-                                      output_dir: Path) -> None:
+def create_comprehensive_category_chart(arrays: StatsArrays, output_dir: Path, dpi: int = DEFAULT_DPI) -> None:
     """
     Create comprehensive bar chart with all repos and categories for each model.
+    Charts are written to output_dir/<model_name>/, which must already exist.
     """
-    categories = ['structure', 'configuration', 'functionality']
-    category_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
-    
-    for model_name, stats in model_stats.items():
+    _render_in_workers(_render_comprehensive_charts, list(zip(arrays.models, arrays.cat_pct)), arrays.repos,
+                       output_dir, dpi)
+
+
+def _render_comprehensive_charts(model_items: List[Tuple[str, np.ndarray]], repos: List[str], output_dir: Path,
+                                 dpi: int) -> None:
+    """Render comprehensive_performance.png for each (model_name, repo x category percentages) in model_items."""
+    # One figure is reused for every model; only the axes are redrawn
+    fig, ax = plt.subplots(figsize=(15, 8))
+    subplot_params = vars(fig.subplotpars).copy()
+    
+    for model_name, repo_data in model_items:
         model_dir = output_dir / model_name
-        model_dir.mkdir(exist_ok=True)
-        
-        # Prepare data
-        repo_data = []
-        for repo in repos:
-            if repo in stats['repos']:
-                repo_percentages = []
-                for category in categories:
-                    cat_data = stats['repos'][repo]['category_data'][category]
-                    if cat_data['max_score'] > 0:
-                        percentage = (cat_data['score'] / cat_data['max_score']) * 100
-                    else:
-                        percentage = 0
-                    repo_percentages.append(percentage)
-                repo_data.append(repo_percentages)
-            else:
-                repo_data.append([0, 0, 0])  # No data for this repo
         
         # Create chart
         x = np.arange(len(repos))
         width = 0.25
         
-        fig, ax = plt.subplots(figsize=(15, 8))
+        _reset_axes(fig, ax, subplot_params)
         
-        for i, category in enumerate(categories):
-            values = [repo_data[j][i] for j in range(len(repos))]
+        for i, category in enumerate(CATEGORIES):
+            values = repo_data[:, i]
             offset = (i - 1) * width
             bars = ax.bar(x + offset, values, width, label=category.title(), 
-                         color=category_colors[i], alpha=0.8)
+                         color=CAT_COLORS[i], alpha=0.8)
             
             # Add value labels
             for bar, value in zip(bars, values):
@@ -388,33 +651,33 @@ def create_comprehensive_category_chart(model_stats: Dict[str, Any], repos: List
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(model_dir / 'comprehensive_performance.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(model_dir / 'comprehensive_performance.png', dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
+    
+    plt.close(fig)
 
 
-def create_error_pie_charts(model_stats: Dict[str, Any], output_dir: Path) -> None:
+def create_error_pie_charts(arrays: StatsArrays, output_dir: Path, dpi: int = DEFAULT_DPI) -> None:
     """
     Create bar charts showing error composition for each model.
+    Charts are written to output_dir/<model_name>/, which must already exist.
     """
-    categories = ['structure', 'configuration', 'functionality']
-    category_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    _render_in_workers(_render_error_charts, list(zip(arrays.models, arrays.error_pct)), output_dir, dpi)
+
+
+def _render_error_charts(model_items: List[Tuple[str, np.ndarray]], output_dir: Path, dpi: int) -> None:
+    """Render error_distribution.png for each (model_name, category error percentages) in model_items."""
+    # One figure is reused for every model; only the axes are redrawn
+    fig, ax = plt.subplots(figsize=(10, 6))
+    subplot_params = vars(fig.subplotpars).copy()
     
-    for model_name, stats in model_stats.items():
+    for model_name, error_percentages in model_items:
         model_dir = output_dir / model_name
-        model_dir.mkdir(exist_ok=True)
-        
-        # Calculate error percentages (percentage points lost in each category)
-        error_percentages = []
-        for category in categories:
-            category_percentage = stats['category_percentages'][category]
-            error_percentage = 100 - category_percentage  # Points lost
-            error_percentages.append(error_percentage)
         
         # Create bar chart
-        fig, ax = plt.subplots(figsize=(10, 6))
+        _reset_axes(fig, ax, subplot_params)
         
-        bars = ax.bar(categories, error_percentages, color=category_colors, alpha=0.8)
+        bars = ax.bar(CATEGORIES, error_percentages, color=CAT_COLORS, alpha=0.8)
         
         # Add value labels on bars
         for bar, error_pct in zip(bars, error_percentages):
@@ -430,12 +693,14 @@ def create_error_pie_charts(model_stats: Dict[str, Any], output_dir: Path) -> No
         ax.set_ylim(0, 110)
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(model_dir / 'error_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(model_dir / 'error_distribution.png', dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
+    
+    plt.close(fig)
 
 
-def create_repo_composition_comparison(model_stats: Dict[str, Any], repos: List[str], output_dir: Path) -> None:
+def create_repo_composition_comparison(model_stats: Dict[str, Any], repos: List[str], output_dir: Path,
+                                       dpi: int = DEFAULT_DPI) -> None:
     """
     Create ring pie charts comparing original vs modified score compositions for specific repositories.
     """
@@ -472,13 +737,10 @@ def create_repo_composition_comparison(model_stats: Dict[str, Any], repos: List[
     if n_repos == 1:
         axes = axes.reshape(2, 1)
     
-    categories = ['structure', 'configuration', 'functionality']
-    category_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
-    
     for col, repo in enumerate(available_repos):
         # Calculate current (modified) composition from any available model
         # Use the first available model's data for this repo
-        current_composition = {'structure': 0, 'configuration': 0, 'functionality': 0}
+        current_composition = dict.fromkeys(CATEGORIES, 0)
         
         # Find a model that has data for this repo
         sample_model = None
@@ -489,7 +751,7 @@ def create_repo_composition_comparison(model_stats: Dict[str, Any], repos: List[
         
         if sample_model:
             repo_data = model_stats[sample_model]['repos'][repo]['category_data']
-            for category in categories:
+            for category in CATEGORIES:
                 current_composition[category] = repo_data[category]['max_score']
         else:
             print(f"  Warning: No model data found for repo {repo}")
@@ -497,18 +759,18 @@ def create_repo_composition_comparison(model_stats: Dict[str, Any], repos: List[
         
         # Original composition
         original = original_compositions[repo]
-        orig_values = [original[cat] for cat in categories]
+        orig_values = [original[cat] for cat in CATEGORIES]
         orig_total = sum(orig_values)
         
         # Current composition  
-        current_values = [current_composition[cat] for cat in categories]
+        current_values = [current_composition[cat] for cat in CATEGORIES]
         current_total = sum(current_values)
         
         # Create original pie chart (top row)
         if orig_total > 0:
             wedges, texts, autotexts = axes[0, col].pie(
-                orig_values, labels=categories, colors=category_colors,
-                autopct=lambda pct, allvals=orig_values: f'{int(pct/100*sum(allvals))}',
+                orig_values, labels=CATEGORIES, colors=CAT_COLORS,
+                autopct=lambda pct, total=orig_total: f'{int(pct/100*total)}',
                 startangle=90, wedgeprops=dict(width=0.5)
             )
             axes[0, col].set_title(f'{repo}\nOriginal (Total: {orig_total})', 
@@ -517,8 +779,8 @@ def create_repo_composition_comparison(model_stats: Dict[str, Any], repos: List[
         # Create current pie chart (bottom row)
         if current_total > 0:
             wedges, texts, autotexts = axes[1, col].pie(
-                current_values, labels=categories, colors=category_colors,
-                autopct=lambda pct, allvals=current_values: f'{int(pct/100*sum(allvals))}',
+                current_values, labels=CATEGORIES, colors=CAT_COLORS,
+                autopct=lambda pct, total=current_total: f'{int(pct/100*total)}',
                 startangle=90, wedgeprops=dict(width=0.5)
             )
             axes[1, col].set_title(f'Modified (Total: {current_total})', 
@@ -537,14 +799,37 @@ def create_repo_composition_comparison(model_stats: Dict[str, Any], repos: List[
     plt.tight_layout()
     plt.subplots_adjust(top=0.90)
     
-    plt.savefig(output_dir / 'repo_composition_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'repo_composition_comparison.png', dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
     plt.close()
 
 
+def _find_model_pairs(model_names: Iterable[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Match each PAIR_TARGETS identifier to its baseline and "ours" model in one pass.
+    
+    A model counts for every target its name contains; when several models match
+    the same target and role, the last one wins.
+    
+    Args:
+        model_names: Model names, in model_stats order
+        
+    Returns:
+        Dictionary mapping each target to (baseline_model, ours_model), None where missing
+    """
+    baseline = dict.fromkeys(PAIR_TARGETS)
+    ours = dict.fromkeys(PAIR_TARGETS)
+    for model_name in model_names:
+        role = ours if "ours" in model_name else baseline
+        for target in PAIR_TARGETS:
+            if target in model_name:
+                role[target] = model_name
+    return {target: (baseline[target], ours[target]) for target in PAIR_TARGETS}
+
+
 def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str], 
                                   reports_base_dir: str = "reports-by-repo", 
                                   rubrics_dir: str = "rubrics/manual",
-                                  output_dir: Path = None) -> None:
+                                  output_dir: Path = None, dpi: int = DEFAULT_DPI) -> None:
     """
     Create detailed heatmap showing individual test performance for each model.
     
@@ -557,23 +842,12 @@ def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str
     """
     import matplotlib.colors as mcolors
     
-    # Order models according to target_strings pairing
-    target_strings = ["opus4", "35haiku", "gpt41", "gpt41mini"]
+    # Order models according to PAIR_TARGETS pairing
+    model_pairs = _find_model_pairs(model_stats.keys())
     ordered_models = []
     
     # First, add paired models (baseline + ours) for each target string
-    for target in target_strings:
-        baseline_model = None
-        ours_model = None
-        
-        # Find matching pairs
-        for model_name in model_stats.keys():
-            if target in model_name:
-                if "ours" in model_name:
-                    ours_model = model_name
-                else:
-                    baseline_model = model_name
-        
+    for baseline_model, ours_model in model_pairs.values():
         # Add baseline model first, then ours model
         if baseline_model and ours_model:
             ordered_models.append(baseline_model)
@@ -593,7 +867,7 @@ def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str
         
         try:
             # Load rubric to get test information
-            categories, max_scores = load_rubric_categories(repo, rubrics_dir)
+            lookup = load_rubric_categories(repo, rubrics_dir)
         except (FileNotFoundError, ValueError) as e:
             print(f"    Warning: Could not load rubric for {repo}: {e}")
             continue
@@ -607,8 +881,7 @@ def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str
         
         for model_name, report_path in model_reports:
             try:
-                with open(report_path, 'r') as f:
-                    report = json.load(f)
+                report = load_json_cached(report_path)
                 
                 test_results = report.get('test_results', [])
                 
@@ -617,11 +890,11 @@ def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str
                     actual_score = test_result.get('score', 0)
                     
                     # Ensure test_id exists in rubric
-                    if test_id not in max_scores:
+                    if test_id not in lookup:
                         raise ValueError(f"Test ID '{test_id}' not found in rubric for repository {repo}, model {model_name}. "
                                        f"This indicates a mismatch between the evaluation report and rubric file.")
                     
-                    test_max_score = max_scores[test_id]
+                    test_max_score = lookup[test_id][1]
                     
                     if test_id not in test_data:
                         test_data[test_id] = {}
@@ -678,18 +951,7 @@ def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str
         
         # Calculate separator positions based on pairing logic
         current_pos = 0
-        for target in target_strings:
-            baseline_model = None
-            ours_model = None
-            
-            # Find matching pairs
-            for model_name in model_stats.keys():
-                if target in model_name:
-                    if "ours" in model_name:
-                        ours_model = model_name
-                    else:
-                        baseline_model = model_name
-            
+        for baseline_model, ours_model in model_pairs.values():
             # If we found a pair, move position by 2 and add separator
             if baseline_model and ours_model:
                 current_pos += 2
@@ -713,7 +975,7 @@ def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str
         # Create test labels with category information
         test_labels = []
         for test_id in sorted_test_ids:
-            category = categories.get(test_id, 'unknown')
+            category = lookup[test_id][2] if test_id in lookup else 'unknown'
             test_labels.append(f"{test_id}\n({category})")
         
         ax.set_xticklabels(test_labels, rotation=45, ha='right', fontsize=8)
@@ -747,32 +1009,21 @@ def create_detailed_test_comparison(model_stats: Dict[str, Any], repos: List[str
         repo_output_dir.mkdir(exist_ok=True)
         
         plt.savefig(repo_output_dir / f'{repo}_detailed_test_heatmap.png', 
-                   dpi=300, bbox_inches='tight')
+                   dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
         plt.close()
         
         print(f"    Created detailed test heatmap: {repo_output_dir / f'{repo}_detailed_test_heatmap.png'}")
 
 
-def create_ours_vs_baseline_comparison(model_stats: Dict[str, Any], output_dir: Path) -> None:
+def create_ours_vs_baseline_comparison(model_stats: Dict[str, Any], output_dir: Path, dpi: int = DEFAULT_DPI) -> None:
     """
     Create side-by-side comparison of "ours" methods vs baseline methods.
     Compares error rates for models containing specific identifiers.
     """
-    target_strings = ["opus4", "35haiku", "gpt41", "gpt41mini"]
     comparison_pairs = {}
     
     # Find matching pairs
-    for target in target_strings:
-        ours_model = None
-        baseline_model = None
-        
-        for model_name in model_stats.keys():
-            if target in model_name:
-                if "ours" in model_name:
-                    ours_model = model_name
-                else:
-                    baseline_model = model_name
-        
+    for target, (baseline_model, ours_model) in _find_model_pairs(model_stats.keys()).items():
         if ours_model is None or baseline_model is None:
             raise ValueError(f"Missing pair for '{target}': found ours='{ours_model}', baseline='{baseline_model}'. "
                            f"Expected to find both 'ours' and non-'ours' models containing '{target}'.")
@@ -829,7 +1080,7 @@ def create_ours_vs_baseline_comparison(model_stats: Dict[str, Any], output_dir:
                        fontweight='bold', color='red')
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'ours_vs_baseline_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig(output_dir / 'ours_vs_baseline_comparison.png', dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
     plt.close()
     
     # Print summary
@@ -842,11 +1093,11 @@ def create_ours_vs_baseline_comparison(model_stats: Dict[str, Any], output_dir:
               f"({'+'if improvement >= 0 else ''}{improvement:.1f}pp)")
 
 
-def create_combined_error_visualization(model_stats: Dict[str, Any], output_dir: Path) -> None:
+def create_combined_error_visualization(arrays: StatsArrays, output_dir: Path, dpi: int = DEFAULT_DPI) -> None:
     """
     Create a combined visualization with all model error bar charts.
     """
-    models = list(model_stats.keys())
+    models = arrays.models
     n_models = len(models)
     
     # Calculate grid dimensions
@@ -866,29 +1117,22 @@ def create_combined_error_visualization(model_stats: Dict[str, Any], output_dir:
     else:
         axes = axes.flatten()
     
-    categories = ['structure', 'configuration', 'functionality']
-    category_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    # Error percentages for every model at once; only bars tall enough get a label
+    error_rows = arrays.error_pct
+    label_mask = error_rows > 5
     
     for idx, model_name in enumerate(models):
-        stats = model_stats[model_name]
         ax = axes[idx]
-        
-        # Calculate error percentages
-        error_percentages = []
-        for category in categories:
-            category_percentage = stats['category_percentages'][category]
-            error_percentage = 100 - category_percentage  # Points lost
-            error_percentages.append(error_percentage)
+        error_percentages = error_rows[idx]
         
         # Create bar chart
-        bars = ax.bar(categories, error_percentages, color=category_colors, alpha=0.8)
+        bars = ax.bar(CATEGORIES, error_percentages, color=CAT_COLORS, alpha=0.8)
         
         # Add value labels on bars (only if there's enough space)
-        for bar, error_pct in zip(bars, error_percentages):
-            height = bar.get_height()
-            if height > 5:  # Only show label if bar is tall enough
-                ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                       f'{error_pct:.0f}%', ha='center', va='bottom', fontsize=8)
+        for i in np.flatnonzero(label_mask[idx]):
+            bar = bars[i]
+            ax.text(bar.get_x() + bar.get_width()/2., bar.get_height() + 1,
+                   f'{error_percentages[i]:.0f}%', ha='center', va='bottom', fontsize=8)
         
         ax.set_title(model_name, fontsize=12, fontweight='bold')
         ax.set_ylim(0, 105)
@@ -906,7 +1150,7 @@ def create_combined_error_visualization(model_stats: Dict[str, Any], output_dir:
     plt.tight_layout()
     
     plt.savefig(output_dir / 'combined_error_distributions.png', 
-                dpi=300, bbox_inches='tight')
+                dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
     plt.close()
 
 
@@ -928,8 +1172,7 @@ def collect_zero_scored_evals(repos: List[str], reports_base_dir: str = "reports
         
         for model_name, report_path in model_reports:
             try:
-                with open(report_path, 'r') as f:
-                    report = json.load(f)
+                report = load_json_cached(report_path)
                 
                 # Check summary total score
                 summary = report.get('summary', {})
@@ -954,10 +1197,13 @@ def collect_zero_scored_evals(repos: List[str], reports_base_dir: str = "reports
             print(f"  Saved to: {zero_scored_file}")
 
 
-def generate_summary_report(model_stats: Dict[str, Any], repos: List[str], 
+def generate_summary_report(model_stats: Dict[str, Any], arrays: StatsArrays, repos: List[str],
                            output_dir: Path) -> None:
     """
     Generate a comprehensive summary report in JSON format.
+    
+    Rankings are ordered with a stable argsort over arrays, so tied models keep
+    their model_stats order.
     """
     summary = {
         'repositories_analyzed': repos,
@@ -967,19 +1213,18 @@ def generate_summary_report(model_stats: Dict[str, Any], repos: List[str],
         'detailed_stats': model_stats
     }
     
-    # Model rankings by overall percentage
-    rankings = [(model, stats['overall_percentage']) 
-                for model, stats in model_stats.items()]
-    rankings.sort(key=lambda x: x[1], reverse=True)
-    summary['model_rankings'] = [{'model': model, 'score_percentage': score} 
-                                for model, score in rankings]
+    # Model rankings by overall percentage (scores are taken from model_stats
+    # so they are written exactly as stored there)
+    order = np.argsort(-arrays.overall_pct, kind='stable')
+    summary['model_rankings'] = [{'model': arrays.models[i],
+                                  'score_percentage': model_stats[arrays.models[i]]['overall_percentage']}
+                                 for i in order]
     
     # Category analysis
-    categories = ['structure', 'configuration', 'functionality']
-    for category in categories:
-        cat_rankings = [(model, stats['category_percentages'][category]) 
-                       for model, stats in model_stats.items()]
-        cat_rankings.sort(key=lambda x: x[1], reverse=True)
+    for c, category in enumerate(CATEGORIES):
+        order = np.argsort(-arrays.cat_pct_mean[:, c], kind='stable')
+        cat_rankings = [(arrays.models[i], model_stats[arrays.models[i]]['category_percentages'][category])
+                        for i in order]
         summary['category_analysis'][category] = {
             'best_model': cat_rankings[0][0] if cat_rankings else None,
             'best_score': cat_rankings[0][1] if cat_rankings else 0,
@@ -988,8 +1233,7 @@ def generate_summary_report(model_stats: Dict[str, Any], repos: List[str],
         }
     
     # Save summary
-    with open(output_dir / 'summary_report.json', 'w') as f:
-        json.dump(summary, f, indent=2)
+    write_json(output_dir / 'summary_report.json', summary)
 
 
 def main():
@@ -1017,6 +1261,10 @@ Examples:
                        help="Output directory for statistics and visualizations (default: overview-stats)")
     parser.add_argument("--verbose", action="store_true",
                        help="Enable verbose output")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Do not read or write the parsed-report cache in <output-dir>/.cache")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI,
+                       help=f"Resolution of the generated charts (default: {DEFAULT_DPI}; use 300 for publication figures)")
     
     args = parser.parse_args()
     
@@ -1040,7 +1288,9 @@ Examples:
     
     # Calculate statistics
     print("Calculating model statistics...")
-    model_stats = calculate_model_stats(args.repos, args.reports_dir, args.rubrics_dir)
+    # Parsed reports are cached under the output directory; delete .cache there to invalidate
+    cache_dir = None if args.no_cache else output_dir / ".cache"
+    model_stats, arrays = calculate_model_stats(args.repos, args.reports_dir, args.rubrics_dir, args.verbose, cache_dir)
     
     if not model_stats:
         print("No model statistics found. Check that reports exist.")
@@ -1048,43 +1298,50 @@ Examples:
     
     print(f"Found {len(model_stats)} models: {', '.join(model_stats.keys())}")
     
+    # Per-model chart directories are created once here, not by every chart function
+    for model_name in model_stats:
+        (output_dir / model_name).mkdir(exist_ok=True)
+    
     # Generate visualizations
     print("\nGenerating visualizations...")
+    _lazy_plt()
+    _prewarm_fonts()
     
     # 1. Model average chart
     print("  Creating model average scores chart...")
-    create_model_average_chart(model_stats, output_dir)
+    create_model_average_chart(arrays, output_dir, args.dpi)
     
     # 2. Category charts for each model
     print("  Creating category performance charts...")
-    create_category_charts(model_stats, output_dir)
+    create_category_charts(arrays, output_dir, args.dpi)
     
     # 3. Comprehensive category chart for each model
     print("  Creating comprehensive performance charts...")
-    create_comprehensive_category_chart(model_stats, args.repos, output_dir)
+    create_comprehensive_category_chart(arrays, output_dir, args.dpi)
     
     # 4. Error pie charts for each model
     print("  Creating error distribution charts...")
-    create_error_pie_charts(model_stats, output_dir)
+    create_error_pie_charts(arrays, output_dir, args.dpi)
     
     # 5. Combined error visualization
     print("  Creating combined error visualization...")
-    create_combined_error_visualization(model_stats, output_dir)
+    create_combined_error_visualization(arrays, output_dir, args.dpi)
     
     # 6. Ours vs Baseline comparison
     print("  Creating ours vs baseline comparison...")
     try:
-        create_ours_vs_baseline_comparison(model_stats, output_dir)
+        create_ours_vs_baseline_comparison(model_stats, output_dir, args.dpi)
     except ValueError as e:
         print(f"  Warning: Could not create ours vs baseline comparison: {e}")
     
     # 7. Repository composition comparison
     print("  Creating repository composition comparison...")
-    create_repo_composition_comparison(model_stats, args.repos, output_dir)
+    create_repo_composition_comparison(model_stats, args.repos, output_dir, args.dpi)
     
     # 8. Detailed test comparison for each repository
     print("  Creating detailed test comparisons...")
-    create_detailed_test_comparison(model_stats, args.repos, args.reports_dir, args.rubrics_dir, output_dir)
+    create_detailed_test_comparison(model_stats, args.repos, args.reports_dir, args.rubrics_dir, output_dir,
+                                    args.dpi)
 
     # 9. Collect zero-scored evaluations
     print("  Collecting zero-scored evaluations...")
@@ -1092,7 +1349,7 @@ Examples:
 
     # Generate summary report
     print("  Creating summary report...")
-    generate_summary_report(model_stats, args.repos, output_dir)
+    generate_summary_report(model_stats, arrays, args.repos, output_dir)
     
     print(f"\nAll visualizations saved to: {output_dir}")
     print("Generated files:")
@@ -0,0 +1,91 @@
+"""
+JSON helpers shared by the benchmark scripts.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
+
+# Files above this size (bytes) are memory-mapped when parsed with orjson
+MMAP_MIN_SIZE = 64 * 1024
+
+# Bumped whenever params_digest's output changes, so caches holding generated
+# test ids can tell they were built with a different scheme
+PARAMS_DIGEST_VERSION = 2
+
+
+def read_json(path: Any) -> Any:
+    """
+    Read and parse a JSON file, using orjson when it is available.
+
+    Files larger than MMAP_MIN_SIZE are memory-mapped and parsed in place
+    rather than copied into a bytes object first. Invalid JSON raises
+    json.JSONDecodeError either way (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= MMAP_MIN_SIZE:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as buf:
+                    return orjson.loads(buf)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays to plain Python values for JSON encoding."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(path: Any, data: Any) -> None:
+    """
+    Write data to path as indented JSON, using orjson when it is available.
+
+    numpy arrays and scalars are encoded natively by orjson, and through
+    _json_default otherwise. The file is written under a temporary name and
+    renamed over path, so readers never see a partial file and any hardlinks
+    to the previous file (see batch_evaluate._copy_model_reports) keep its
+    old content instead of changing with it.
+    """
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, default=_json_default,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2, default=_json_default)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def params_digest(params: Any) -> int:
+    """
+    Return a 64-bit content hash of a test's params that is stable across runs.
+
+    Generated ids for rubric tests without an explicit id are built from this,
+    both when batch_evaluate writes reports and when generate_stats looks them
+    up, so the two must always agree. Unlike hash(str(params)), it isn't salted
+    per process.
+    """
+    # Always the stdlib encoding: orjson differs in non-ASCII escaping and float
+    # formatting, which would make the ids depend on whether it is installed
+    encoded = json.dumps(params, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'little')
@@ -5,83 +5,148 @@ Equivalent to run_all_repos.sh but written in Python.
 """
 
 import os
-import glob
+import re
+import json
 import subprocess
 import sys
 import time
 import random
+import select
+import shlex
+import signal
+import threading
 import argparse
-from pathlib import Path
+from itertools import islice
+
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+    def batched(iterable, n):
+        """Yield successive tuples of up to n items from iterable."""
+        it = iter(iterable)
+        while batch := tuple(islice(it, n)):
+            yield batch
 
 # Import rubric validation from batch_evaluate
 from batch_evaluate import validate_all_rubrics
 
-def count_running_screens(repo_names, session_code):
+# Prune only when Docker reports at least this much reclaimable space
+PRUNE_THRESHOLD = 1 << 30
+
+# Cleared if pidfd_open fails at runtime (e.g. ENOSYS on kernels older than 5.3)
+_pidfd_supported = hasattr(os, "pidfd_open")
+
+# Set by the SIGCHLD handler used where os.pidfd_open is unavailable
+_child_exited = threading.Event()
+_sigchld_installed = False
+
+def _wait_for_any_exit(procs, timeout):
     """
-    Count how many screens are still running for our repositories.
+    Block until any of the given processes exits or timeout seconds pass.
+    
+    On Linux this waits on a pidfd per process, so it wakes as soon as one
+    exits; elsewhere (or on kernels without pidfd_open) it waits for SIGCHLD,
+    re-checking the processes on each signal (and at the timeout, in case a
+    signal is missed).
     
     Args:
-        repo_names: List of repository names to check
-        session_code: Unique session identifier to filter our screens
-        
-    Returns:
-        tuple: (success, running_count, running_repos, finished_repos)
-        success: bool - True if check was successful, False if there was an error
+        procs: List of subprocess.Popen objects that were still running
+        timeout: Maximum number of seconds to wait
     """
-    try:
-        # Get list of all active screens
-        result = subprocess.run(['screen', '-ls'], capture_output=True, text=True)
-        screen_output = result.stdout
-        
-        running_repos = []
-        finished_repos = []
-        
-        for repo in repo_names:
-            # Look for our specific repo screen session with session code
-            # screen -ls output format is typically: "PID.session_name"
-            screen_name = f"{session_code}_{repo}"
-            if f".{screen_name}\t" in screen_output or f".{screen_name} " in screen_output:
-                running_repos.append(repo)
+    global _pidfd_supported, _sigchld_installed
+    if _pidfd_supported:
+        fds = []
+        try:
+            for proc in procs:
+                try:
+                    fds.append(os.pidfd_open(proc.pid))
+                except ProcessLookupError:
+                    return  # Already exited and reaped
+                except OSError as e:
+                    print(f"pidfd_open unavailable ({e}); waiting for SIGCHLD instead")
+                    _pidfd_supported = False
+                    break
             else:
-                finished_repos.append(repo)
-        
-        return True, len(running_repos), running_repos, finished_repos
-        
-    except FileNotFoundError:
-        print("Warning: 'screen' command not found. Cannot check running screens.")
-        return False, 0, [], repo_names
-    except subprocess.CalledProcessError:
-        # screen -ls returns non-zero when no screens are running
-        return True, 0, [], repo_names
+                # A pidfd becomes readable once its process exits
+                select.select(fds, [], [], timeout)
+                return
+        finally:
+            for fd in fds:
+                os.close(fd)
+    
+    if not _sigchld_installed:
+        signal.signal(signal.SIGCHLD, lambda signum, frame: _child_exited.set())
+        _sigchld_installed = True
+    
+    deadline = time.monotonic() + timeout
+    while True:
+        # Clear before checking so an exit right after the check still wakes us
+        _child_exited.clear()
+        if any(proc.poll() is not None for proc in procs):
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        _child_exited.wait(remaining)
 
-def wait_for_batch_completion(batch_repos, session_code, check_interval=30):
+def wait_for_batch_completion(batch_procs, check_interval=30):
     """
     Wait for all screens in a batch to complete.
     
     Args:
-        batch_repos: List of repository names in the current batch
-        session_code: Unique session identifier
-        check_interval: How often to check (in seconds)
+        batch_procs: Dict mapping repository name to its screen process
+        check_interval: How often to report progress (in seconds)
     """
-    print(f"⏳ Waiting for batch of {len(batch_repos)} repositories to complete...")
+    print(f"⏳ Waiting for batch of {len(batch_procs)} repositories to complete...")
     start_time = time.time()
+    running = dict(batch_procs)
     
     while True:
-        success, running_count, running_repos, finished_repos = count_running_screens(batch_repos, session_code)
+        running = {repo: proc for repo, proc in running.items() if proc.poll() is None}
         
-        if not success:
-            print(f"Cannot check screen status. Will retry in {check_interval}s...")
-            time.sleep(check_interval)
-            continue
-        
-        if running_count == 0:
+        if not running:
             elapsed = time.time() - start_time
-            print(f"Batch completed in {elapsed:.1f}s. All {len(batch_repos)} repositories finished.")
+            print(f"Batch completed in {elapsed:.1f}s. All {len(batch_procs)} repositories finished.")
             break
         
         elapsed = time.time() - start_time
-        print(f"[{elapsed:.0f}s] Still running: {running_count}/{len(batch_repos)} - {', '.join(running_repos)}")
-        time.sleep(check_interval)
+        print(f"[{elapsed:.0f}s] Still running: {len(running)}/{len(batch_procs)} - {', '.join(running)}")
+        _wait_for_any_exit(list(running.values()), check_interval)
+
+# Multipliers for the decimal units in `docker system df` sizes, e.g. "1.2GB"
+_SIZE_UNITS = {"B": 1, "kB": 10**3, "KB": 10**3, "MB": 10**6, "GB": 10**9, "TB": 10**12, "PB": 10**15}
+_SIZE_RE = re.compile(r"([\d.]+)\s*([kKMGTP]?B)")
+
+def _reclaimable_bytes():
+    """
+    Total space Docker reports as reclaimable across images, containers, volumes and build cache.
+    
+    Returns:
+        Reclaimable size in bytes, or None if it could not be determined
+    """
+    try:
+        result = subprocess.run(
+            ['docker', 'system', 'df', '--format', '{{json .}}'],
+            capture_output=True, text=True, timeout=60
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    
+    total = 0
+    try:
+        for line in result.stdout.splitlines():
+            if not line.strip():
+                continue
+            # Reclaimable looks like "1.2GB (50%)"
+            match = _SIZE_RE.match(json.loads(line).get("Reclaimable", "").strip())
+            if match is None:
+                return None
+            total += int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+    except (ValueError, KeyError, AttributeError):
+        return None
+    return total
 
 def clean_docker_system():
     """
@@ -107,45 +172,54 @@ def launch_batch(batch_repos, session_code, rubric_dir):
     """
     Launch screen sessions for a batch of repositories.
     
+    Each session is started with `screen -DmS`, which runs detached (so it can
+    still be attached to) but keeps the screen process in the foreground until
+    the session ends, letting us wait on it directly instead of polling `screen -ls`.
+    Sessions get their own process session, so a Ctrl-C or hangup sent to this
+    script doesn't also kill the evaluations.
+    
     Args:
         batch_repos: List of repository names to launch
         session_code: Unique session identifier
         rubric_dir: Path to rubrics directory
         
     Returns:
-        List of successfully launched repositories
+        Dict mapping each successfully launched repository to its screen process
     """
-    launched_repos = []
+    launched = {}
+    # The shell command differs only by repo, so build and quote the rest once
+    cmd_prefix = f"python3 batch_evaluate.py --skip-warnings --verbose --rubric-dir {shlex.quote(rubric_dir)} --repo "
     
     for repo in batch_repos:
         screen_name = f"{session_code}_{repo}"
         print(f"  Starting screen for {repo} (session: {screen_name})...")
         
         cmd = [
-            "screen", "-dmS", screen_name, "bash", "-c",
-            f"python3 batch_evaluate.py --skip-warnings --verbose --rubric-dir '{rubric_dir}' --repo '{repo}'"
+            "screen", "-DmS", screen_name, "bash", "-c",
+            cmd_prefix + shlex.quote(repo)
         ]
         
         try:
-            subprocess.run(cmd, check=True)
+            launched[repo] = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, start_new_session=True)
             print(f"    → Screen '{screen_name}' started.")
-            launched_repos.append(repo)
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
+            if isinstance(e, FileNotFoundError):
+                print("    ✗ Error: 'screen' command not found. Please install screen or use an alternative.")
+                sys.exit(1)
             print(f"    ✗ Failed to start screen for '{repo}': {e}")
-        except FileNotFoundError:
-            print("    ✗ Error: 'screen' command not found. Please install screen or use an alternative.")
-            sys.exit(1)
     
-    return launched_repos
+    return launched
 
 def main():
     parser = argparse.ArgumentParser(description="Launch batch evaluation for repositories with resource management")
     parser.add_argument('--batch-size', '-k', type=int, default=8, 
                        help='Number of repositories to process simultaneously (default: 8)')
     parser.add_argument('--check-interval', type=int, default=30,
-                       help='How often to check for completion in seconds (default: 30)')
+                       help='How often to report progress while waiting, in seconds (default: 30)')
     parser.add_argument('--skip-docker-cleanup', action='store_true',
                        help='Skip Docker system cleanup between batches')
+    parser.add_argument('--prune-threshold', type=int, default=PRUNE_THRESHOLD,
+                       help='Only clean Docker between batches when at least this many bytes are reclaimable (default: 1 GiB; 0 always cleans)')
     parser.add_argument('--rubric-dir', type=str, default='rubrics/manual',
                        help='Directory containing rubric JSON files (default: rubrics/manual)')
     
@@ -171,16 +245,15 @@ def main():
         sys.exit(1)
     
     # Find all .json files and extract repo names (without .json extension)
-    json_pattern = os.path.join(rubric_dir, "*.json")
-    json_files = glob.glob(json_pattern)
+    # in a single directory pass; hidden files are skipped as glob would
+    with os.scandir(rubric_dir) as entries:
+        all_repos = [entry.name[:-len(".json")] for entry in entries
+                     if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()]
     
-    if not json_files:
+    if not all_repos:
         print(f"No JSON files found in '{rubric_dir}'")
         sys.exit(1)
     
-    # Extract repo names by removing .json extension
-    all_repos = [Path(f).stem for f in json_files]
-    
     print(f"Found {len(all_repos)} repos:")
     for repo in all_repos:
         print(f"  - {repo}")
@@ -211,32 +284,33 @@ def main():
     total_batches = (len(all_repos) + args.batch_size - 1) // args.batch_size
     completed_repos = []
     
-    for batch_num in range(total_batches):
-        start_idx = batch_num * args.batch_size
-        end_idx = min(start_idx + args.batch_size, len(all_repos))
-        batch_repos = all_repos[start_idx:end_idx]
-        
-        print(f"🔄 Starting batch {batch_num + 1}/{total_batches} ({len(batch_repos)} repositories)")
+    for batch_num, batch_repos in enumerate(batched(all_repos, args.batch_size), start=1):
+        print(f"🔄 Starting batch {batch_num}/{total_batches} ({len(batch_repos)} repositories)")
         print(f"   Repositories: {', '.join(batch_repos)}")
         
         # Launch batch
-        launched_repos = launch_batch(batch_repos, session_code, rubric_dir)
+        launched = launch_batch(batch_repos, session_code, rubric_dir)
+        launched_repos = list(launched)
         
         if not launched_repos:
-            print(f"⚠️  No repositories were successfully launched in batch {batch_num + 1}")
+            print(f"⚠️  No repositories were successfully launched in batch {batch_num}")
             continue
         
-        print(f"✅ Batch {batch_num + 1} launched: {len(launched_repos)} screens started")
+        print(f"✅ Batch {batch_num} launched: {len(launched_repos)} screens started")
         
         # Wait for batch to complete
-        time.sleep(5)  # Short delay before checking
-        wait_for_batch_completion(launched_repos, session_code, args.check_interval)
+        wait_for_batch_completion(launched, args.check_interval)
         completed_repos.extend(launched_repos)
         
         # Clean Docker system between batches
         if not args.skip_docker_cleanup:
             time.sleep(5)  # Short delay before cleaning
-            clean_docker_system()
+            reclaimable = _reclaimable_bytes() if args.prune_threshold > 0 else None
+            # An unknown size cleans anyway, as before the threshold existed
+            if reclaimable is None or reclaimable >= args.prune_threshold:
+                clean_docker_system()
+            else:
+                print(f"🧹 Skipping Docker cleanup: only {reclaimable / 10**9:.2f}GB reclaimable")
             print()  # Add spacing before next batch
     
     # Final summary
@@ -5,17 +5,25 @@ Serves files with CORS headers to allow local file access
 """
 
 import http.server
-import socketserver
 import os
 import sys
 from pathlib import Path
 
 class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections alive so a page's many asset requests share one TCP connection
+    protocol_version = "HTTP/1.1"
+    
     def end_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         super().end_headers()
+    
+    def copyfile(self, source, outputfile):
+        # socket.sendfile() moves file bodies with os.sendfile where it can, and
+        # falls back to plain sends itself (e.g. for in-memory directory listings)
+        outputfile.flush()
+        self.connection.sendfile(source)
 
 def main():
     # Change to the parent directory (EnvEval root) to serve both website and dataset
@@ -32,7 +40,9 @@ def main():
     print(f"⚠️  Press Ctrl+C to stop the server")
     print("-" * 50)
     
-    with socketserver.TCPServer(("", PORT), CORSRequestHandler) as httpd:
+    # One thread per connection, so a large dataset download doesn't block other
+    # requests (HTTPServer already sets allow_reuse_address for quick restarts)
+    with http.server.ThreadingHTTPServer(("", PORT), CORSRequestHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt: